@@ -0,0 +1,72 @@
+"""
+Shared pytest fixtures for the Pensieve test suite.
+"""
+
+import pytest
+
+from src.processing.pensieve_hybrid_processor import create_pensieve_processor
+
+
+@pytest.fixture(scope="session")
+def shared_processor():
+    """One hybrid processor for the whole session; its components load configs and probe providers."""
+    return create_pensieve_processor()
+
+
+@pytest.fixture
+def processor(shared_processor):
+    """The shared processor, with the state a test can change restored afterwards."""
+    stats = shared_processor.processing_stats.copy()
+    preprocessing_enabled = shared_processor.preprocessing_enabled
+
+    yield shared_processor
+
+    shared_processor.processing_stats = stats
+    shared_processor.preprocessing_enabled = preprocessing_enabled
+    # Cached AI responses and provider routes would leak one test's mocks into the next.
+    # Meeting analyses only depend on the transcript, so they stay cached and the
+    # pre-AI pipeline runs once per transcript for the whole session
+    shared_processor._response_cache.clear()
+    shared_processor._provider_routes.clear()
+
+
+@pytest.fixture(scope="session")
+def sample_transcript():
+    """Sample transcript for testing."""
+    return """
+    John Smith 09:00:15
+    Good morning everyone, let's start with our architecture review for the new booking service.
+    
+    Alice Johnson 09:00:30
+    Thanks John. I've been working on the microservice design for our payment flow.
+    
+    Bob Wilson 09:01:00
+    Great work Alice. I have some concerns about the database scalability approach.
+    
+    John Smith 09:01:15
+    Let's discuss the technical trade-offs. We need to consider performance implications.
+    
+    Alice Johnson 09:02:00
+    The service-oriented architecture will help us scale better than our current monolith.
+    
+    Bob Wilson 09:02:30
+    I agree. My action item is to create a performance testing plan by next week.
+    
+    John Smith 09:03:00
+    Perfect. Alice, can you finalize the API specifications by Friday?
+    
+    Alice Johnson 09:03:15
+    Absolutely. I'll have the complete API documentation ready.
+    """
+
+
+@pytest.fixture(scope="session")
+def mock_transcript_file(tmp_path_factory, sample_transcript):
+    """A mock transcript file, written once per session; tests must not modify it."""
+    meeting_folder = tmp_path_factory.mktemp("zoom") / "2025-01-18 09.00.00 Architecture Review Meeting"
+    meeting_folder.mkdir()
+
+    transcript_file = meeting_folder / "meeting_saved_closed_caption.txt"
+    transcript_file.write_text(sample_transcript)
+
+    return transcript_file
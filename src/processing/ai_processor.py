@@ -9,13 +9,23 @@ import requests
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 from ..utils.config import get_config
 from ..utils.logger import get_logger, log_performance_metrics
 from .context_aware_chunker import ContextAwareChunker, ContextualChunk
 
 
+def add_slots(cls):
+    """Rebuild a dataclass with __slots__ (dataclass(slots=True) needs Python 3.10)."""
+    field_names = tuple(field.name for field in fields(cls))
+    namespace = dict(cls.__dict__)
+    for name in field_names + ('__dict__', '__weakref__'):
+        namespace.pop(name, None)
+    namespace['__slots__'] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
 @dataclass
 class MeetingMetadata:
     """Metadata extracted from meeting transcript."""
@@ -28,6 +38,7 @@ class MeetingMetadata:
     file_size: int
 
 
+@add_slots
 @dataclass
 class ProcessingResult:
     """Result of transcript processing."""
@@ -38,6 +49,13 @@ class ProcessingResult:
     processing_time: float = 0.0
     model_used: str = ""
     chunks_processed: int = 0
+    # Set by the hybrid processor
+    ai_provider_used: Optional[str] = None
+    quality_metrics: Optional[Any] = None  # QualityMetrics
+    processing_strategy: Optional[str] = None
+    provider_processing_time: Optional[float] = None
+    tokens_used: Optional[int] = None
+    provider_metadata: Optional[Dict[str, Any]] = None
 
 
 class TranscriptParser:
@@ -464,12 +482,18 @@ class AIProcessor:
         if hasattr(self.config.processing, 'chunking') and self.config.processing.chunking:
             chunk_size = self.config.processing.chunking.get('max_chunk_size', 2000)
             overlap_size = self.config.processing.chunking.get('overlap_size', 300)
+            semantic_boundaries = self.config.processing.chunking.get('semantic_boundaries', False)
         else:
             chunk_size = 2000
             overlap_size = 300
+            semantic_boundaries = False
         
         # Use context-aware chunker for better quality
-        self.context_chunker = ContextAwareChunker(max_chunk_size=chunk_size, overlap_size=overlap_size)
+        self.context_chunker = ContextAwareChunker(
+            max_chunk_size=chunk_size,
+            overlap_size=overlap_size,
+            semantic_boundaries=semantic_boundaries
+        )
         # Keep old chunker for fallback
         self.chunker = TranscriptChunker(max_chunk_size=chunk_size)
         
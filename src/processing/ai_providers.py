@@ -89,6 +89,13 @@ class AIProvider(ABC):
         """Check if the provider can handle the full transcript without chunking."""
         pass
     
+    @staticmethod
+    def _estimate_tokens(context: ProcessingContext) -> int:
+        """Token estimate computed once by the caller, else ~4 characters per token."""
+        if context.estimated_tokens is not None:
+            return context.estimated_tokens
+        return context.file_size // 4
+    
     @abstractmethod
     def generate_summary(self, prompt: str, transcript: str, context: ProcessingContext) -> AIResponse:
         """Generate a summary using the provider."""
@@ -158,7 +165,7 @@ class ClaudeProvider(AIProvider):
     def supports_full_transcript(self, context: ProcessingContext) -> bool:
         """Claude 3.5 Sonnet can handle very large transcripts."""
         # Estimate tokens (rough approximation: 1 token ≈ 4 characters)
-        estimated_tokens = context.file_size // 4
+        estimated_tokens = self._estimate_tokens(context)
         
         # Reserve space for prompt and response
         max_input_tokens = self.max_context_tokens - 4000  # Reserve 4k for prompt + response
@@ -334,7 +341,7 @@ class OllamaProvider(AIProvider):
     def supports_full_transcript(self, context: ProcessingContext) -> bool:
         """Ollama typically needs chunking for large transcripts."""
         # Conservative estimate: 1 token ≈ 4 characters
-        estimated_tokens = context.file_size // 4
+        estimated_tokens = self._estimate_tokens(context)
         
         # Reserve space for prompt and response
         max_input_tokens = self.max_context_tokens - 2000
@@ -511,6 +518,7 @@ class AIProviderManager:
     def __init__(self):
         self.logger = get_logger("ai_provider_manager")
         self.providers: List[AIProvider] = []
+        self.providers_by_name: Dict[str, AIProvider] = {}
         self._load_providers()
     
     def _load_providers(self) -> None:
@@ -582,12 +590,17 @@ class AIProviderManager:
         
         # Sort providers by priority
         self.providers.sort(key=lambda p: p.get_priority())
+        self.providers_by_name = {provider.config.name: provider for provider in self.providers}
         
         if not self.providers:
             raise RuntimeError("No AI providers available")
         
         self.logger.info(f"Loaded {len(self.providers)} AI providers")
     
+    def get_provider(self, name: str) -> Optional[AIProvider]:
+        """Get a provider by its configured name."""
+        return self.providers_by_name.get(name)
+    
     def get_best_provider(self, context: ProcessingContext) -> Optional[AIProvider]:
         """Get the best available provider for the given context with cost optimization."""
         
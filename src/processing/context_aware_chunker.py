@@ -4,6 +4,7 @@ Preserves relationships and context across chunks, similar to Cursor's approach.
 """
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
@@ -11,6 +12,17 @@ from pathlib import Path
 from ..utils.logger import get_logger
 
 
+# Sentence embedding model used for semantic chunk boundaries (optional dependency)
+SEMANTIC_MODEL_NAME = "all-MiniLM-L6-v2"
+
+
+@lru_cache(maxsize=2)
+def _load_embedding_model(model_name: str):
+    """Load a sentence-transformers model once per process."""
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_name)
+
+
 @dataclass
 class ChunkContext:
     """Context information for a chunk."""
@@ -40,9 +52,12 @@ class ContextAwareChunker:
     Uses techniques similar to Cursor's document processing.
     """
     
-    def __init__(self, max_chunk_size: int = 2500, overlap_size: int = 300):
+    def __init__(self, max_chunk_size: int = 2500, overlap_size: int = 300,
+                 semantic_boundaries: bool = False, similarity_threshold: float = 0.75):
         self.max_chunk_size = max_chunk_size
         self.overlap_size = overlap_size
+        self.semantic_boundaries = semantic_boundaries
+        self.similarity_threshold = similarity_threshold
         self.logger = get_logger("context_chunker")
         
         # Patterns for identifying important content
@@ -63,6 +78,26 @@ class ContextAwareChunker:
             r'\b(action|task|todo|follow.?up)\b',
             r'\b(by|due|deadline|timeline)\b'
         ]
+        
+        # Each pattern family compiled once into a single alternation
+        self._technical_re = self._compile_alternation(self.technical_patterns)
+        self._decision_re = self._compile_alternation(self.decision_patterns)
+        self._action_re = self._compile_alternation(self.action_patterns)
+        
+        # Technical keyword -> topic, checked in priority order
+        self._technical_topics = {
+            'architecture': 'technical_architecture',
+            'system': 'technical_architecture',
+            'api': 'api_service',
+            'service': 'api_service',
+            'deploy': 'deployment_testing',
+            'test': 'deployment_testing'
+        }
+    
+    @staticmethod
+    def _compile_alternation(patterns: List[str]) -> re.Pattern:
+        """Combine a list of patterns into one compiled regex."""
+        return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
     
     def should_chunk(self, content: str) -> bool:
         """Determine if content needs chunking."""
@@ -174,24 +209,18 @@ class ContextAwareChunker:
         line_lower = line.lower()
         
         # Technical topics
-        for pattern in self.technical_patterns:
-            if re.search(pattern, line_lower):
-                if 'architecture' in line_lower or 'system' in line_lower:
-                    return 'technical_architecture'
-                elif 'api' in line_lower or 'service' in line_lower:
-                    return 'api_service'
-                elif 'deploy' in line_lower or 'test' in line_lower:
-                    return 'deployment_testing'
+        if self._technical_re.search(line_lower):
+            for keyword, topic in self._technical_topics.items():
+                if keyword in line_lower:
+                    return topic
         
         # Decision topics
-        for pattern in self.decision_patterns:
-            if re.search(pattern, line_lower):
-                return 'decision_making'
+        if self._decision_re.search(line_lower):
+            return 'decision_making'
         
         # Action/planning topics
-        for pattern in self.action_patterns:
-            if re.search(pattern, line_lower):
-                return 'action_planning'
+        if self._action_re.search(line_lower):
+            return 'action_planning'
         
         return current_topic
     
@@ -199,6 +228,11 @@ class ContextAwareChunker:
         """
         Group segments into chunks while preserving semantic boundaries.
         """
+        if self.semantic_boundaries:
+            boundaries = self._semantic_boundaries(segments)
+            if boundaries is not None:
+                return self._split_at_boundaries(segments, boundaries)
+        
         chunks = []
         current_chunk_segments = []
         current_size = 0
@@ -231,6 +265,56 @@ class ContextAwareChunker:
         
         return chunks
     
+    def _semantic_boundaries(self, segments: List[Dict[str, Any]]) -> Optional[List[int]]:
+        """
+        Choose chunk boundaries where adjacent segments drift apart in meaning
+        (TextTiling over sentence embeddings).
+        
+        Returns indices of the segments that start a new chunk, or None when
+        embeddings are unavailable so the caller falls back to size-only grouping.
+        """
+        if len(segments) < 2:
+            return []
+        
+        try:
+            model = _load_embedding_model(SEMANTIC_MODEL_NAME)
+            embeddings = model.encode(
+                [segment['content'] for segment in segments],
+                batch_size=64,
+                normalize_embeddings=True
+            )
+        except Exception as e:
+            self.logger.warning(f"Semantic boundaries unavailable, using size-based chunking: {e}")
+            return None
+        
+        # Cosine similarity of each segment with the next (embeddings are unit length)
+        similarities = (embeddings[:-1] * embeddings[1:]).sum(axis=1)
+        
+        min_size = self.max_chunk_size // 2
+        boundaries = []
+        current_size = len(segments[0]['content'])
+        
+        for i in range(1, len(segments)):
+            segment_size = len(segments[i]['content'])
+            topic_shift = similarities[i - 1] < self.similarity_threshold
+            
+            # Cut at a topic shift once the chunk is big enough, or when it would overflow
+            if (topic_shift and current_size >= min_size) or current_size + segment_size > self.max_chunk_size:
+                boundaries.append(i)
+                current_size = segment_size
+            else:
+                current_size += segment_size
+        
+        return boundaries
+    
+    def _split_at_boundaries(self, segments: List[Dict[str, Any]], boundaries: List[int]) -> List[str]:
+        """Join segments into chunks, starting a new chunk at each boundary index."""
+        starts = [0] + boundaries
+        ends = boundaries + [len(segments)]
+        
+        return ['\n\n'.join(segment['content'] for segment in segments[start:end])
+                for start, end in zip(starts, ends)]
+    
     def _add_context_preservation(self, raw_chunks: List[str], metadata: Any) -> List[ContextualChunk]:
         """
         Add context preservation to chunks.
@@ -238,12 +322,10 @@ class ContextAwareChunker:
         """
         contextual_chunks = []
         previous_context_summary = None
+        total_chunks = len(raw_chunks)
         
         for i, chunk_content in enumerate(raw_chunks):
             chunk_number = i + 1
-            total_chunks = len(raw_chunks)
-            
-            # Extract context for this chunk
             context = self._extract_chunk_context(chunk_content, chunk_number, total_chunks)
             
             # Add overlap content if not first chunk
@@ -273,17 +355,20 @@ class ContextAwareChunker:
     def _extract_chunk_context(self, content: str, chunk_num: int, total_chunks: int) -> ChunkContext:
         """Extract context information from a chunk."""
         
+        # Lowercase once and share it across all keyword scans
+        content_lower = content.lower()
+        
         # Extract entities (people, systems, technical terms)
-        entities = self._extract_entities(content)
+        entities = self._extract_entities(content, content_lower)
         
         # Identify ongoing discussions
-        ongoing_discussions = self._identify_discussions(content)
+        ongoing_discussions = self._identify_discussions(content_lower)
         
         # Extract decisions made
-        decisions = self._extract_decisions(content)
+        decisions = self._extract_decisions(content, content_lower)
         
         # Extract action items
-        actions = self._extract_actions(content)
+        actions = self._extract_actions(content, content_lower)
         
         # Generate topic summary
         topic_summary = self._generate_topic_summary(content, entities, ongoing_discussions)
@@ -297,7 +382,7 @@ class ContextAwareChunker:
             action_items=actions
         )
     
-    def _extract_entities(self, content: str) -> List[str]:
+    def _extract_entities(self, content: str, content_lower: str) -> List[str]:
         """Extract key entities (people, systems, technical terms)."""
         entities = set()
         
@@ -309,7 +394,6 @@ class ContextAwareChunker:
                 entities.add(speaker)
         
         # Extract technical terms
-        content_lower = content.lower()
         technical_terms = ['api', 'service', 'module', 'system', 'database', 'architecture', 
                           'deployment', 'testing', 'integration', 'performance', 'security']
         
@@ -319,27 +403,25 @@ class ContextAwareChunker:
         
         return list(entities)[:10]  # Limit to top 10 entities
     
-    def _identify_discussions(self, content: str) -> List[str]:
+    def _identify_discussions(self, content_lower: str) -> List[str]:
         """Identify ongoing discussion topics."""
         discussions = []
         
         # Look for question-answer patterns
-        if '?' in content:
+        if '?' in content_lower:
             discussions.append("Q&A discussion")
         
         # Look for decision-making language
         decision_keywords = ['option', 'choice', 'decide', 'approach', 'solution']
         for keyword in decision_keywords:
-            if keyword in content.lower():
+            if keyword in content_lower:
                 discussions.append(f"Decision about {keyword}")
                 break
         
         return discussions
     
-    def _extract_decisions(self, content: str) -> List[str]:
+    def _extract_decisions(self, content: str, content_lower: str) -> List[str]:
         """Extract decisions made in this chunk."""
-        decisions = []
-        
         # Look for decision language
         decision_phrases = [
             r'we (decided|agreed|concluded)',
@@ -348,21 +430,11 @@ class ContextAwareChunker:
             r'final (decision|choice)'
         ]
         
-        for phrase in decision_phrases:
-            matches = re.finditer(phrase, content.lower())
-            for match in matches:
-                # Extract surrounding context
-                start = max(0, match.start() - 50)
-                end = min(len(content), match.end() + 100)
-                decision_context = content[start:end].strip()
-                decisions.append(decision_context)
-        
-        return decisions[:3]  # Limit to top 3 decisions
+        # Surrounding context: 50 chars before, 100 after; limit to top 3 decisions
+        return self._extract_match_contexts(content, content_lower, decision_phrases, 50, 100, 3)
     
-    def _extract_actions(self, content: str) -> List[str]:
+    def _extract_actions(self, content: str, content_lower: str) -> List[str]:
         """Extract action items from this chunk."""
-        actions = []
-        
         # Look for action language
         action_phrases = [
             r'(will|should|need to) \w+',
@@ -371,16 +443,27 @@ class ContextAwareChunker:
             r'by (next week|tomorrow|friday)'
         ]
         
-        for phrase in action_phrases:
-            matches = re.finditer(phrase, content.lower())
-            for match in matches:
-                # Extract surrounding context
-                start = max(0, match.start() - 30)
-                end = min(len(content), match.end() + 80)
-                action_context = content[start:end].strip()
-                actions.append(action_context)
+        # Surrounding context: 30 chars before, 80 after; limit to top 5 actions
+        return self._extract_match_contexts(content, content_lower, action_phrases, 30, 80, 5)
+    
+    def _extract_match_contexts(self, content: str, content_lower: str, phrases: List[str],
+                                before: int, after: int, limit: int) -> List[str]:
+        """
+        Extract the text surrounding phrase matches, in phrase order.
+        Only match spans are recorded while scanning; substrings are sliced
+        once, for the retained results.
+        """
+        spans = []
+        
+        for phrase in phrases:
+            for match in re.finditer(phrase, content_lower):
+                spans.append((max(0, match.start() - before), min(len(content), match.end() + after)))
+                if len(spans) == limit:
+                    break
+            if len(spans) == limit:
+                break
         
-        return actions[:5]  # Limit to top 5 actions
+        return [content[start:end].strip() for start, end in spans]
     
     def _generate_topic_summary(self, content: str, entities: List[str], discussions: List[str]) -> str:
         """Generate a brief topic summary for this chunk."""
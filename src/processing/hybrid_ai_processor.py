@@ -3,19 +3,144 @@ Hybrid AI Processor for Pensieve.
 Integrates multiple AI providers with intelligent fallback and quality assessment.
 """
 
+import asyncio
 import json
+import os
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable, Set, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
 from .ai_providers import AIProviderManager, ProcessingContext, AIResponse
-from .ai_processor import TranscriptParser, ProcessingResult, MeetingMetadata
+from .ai_processor import TranscriptParser, ProcessingResult, MeetingMetadata, add_slots
 from ..utils.config import get_config
 from ..utils.logger import get_logger, log_performance_metrics
 
 
+# Keyword sets used by QualityAssessor (matched as lowercase substrings)
+TECHNICAL_TERMS = (
+    "api", "service", "system", "architecture", "framework",
+    "database", "server", "client", "endpoint", "integration",
+    "deployment", "authentication", "authorization", "oauth",
+    "microservices", "rest", "graphql", "json", "xml",
+    "kubernetes", "docker", "aws", "azure", "gcp",
+    "python", "java", "javascript", "typescript", "react",
+    "node", "express", "spring", "django", "flask"
+)
+DOMAIN_TECHNICAL_TERMS = ("multiplier", "cullinson", "booking")
+BUSINESS_TERMS = (
+    "revenue", "customer", "product", "market", "business",
+    "strategy", "growth", "impact", "value", "roi",
+    "profit", "cost", "budget", "investment", "kpi"
+)
+DOMAIN_TERMS = ("flights", "booking", "travel", "hotel", "ancillary")
+STRATEGIC_TERMS = ("strategy", "roadmap", "priority", "objective")
+SECTION_TERMS = ("business", "technical", "action", "decision", "challenge")
+HEADER_MARKERS = ("# ",)  # also covers "## "
+LIST_MARKERS = ("- ", "* ")
+GENERIC_PHRASES = (
+    "the team discussed", "improving collaboration", "better communication",
+    "working together", "moving forward", "next steps"
+)
+ACTION_PATTERNS = (
+    "- [ ]", "- [x]", "TODO:", "Action:", "Follow-up:",
+    "@" + "person", "Due:", "Timeline:", "Next step"
+)
+ACTION_PATTERNS_LOWER = tuple(pattern.lower() for pattern in ACTION_PATTERNS)
+MENTION_TASK_WORDS = ("due", "timeline", "task", "action")
+
+
+class KeywordMatcher:
+    """
+    Finds which of a fixed set of terms occur in a text, in one regex pass.
+    
+    Terms are matched as plain substrings, including overlapping ones
+    (e.g. both "java" and "javascript"), so results equal checking
+    `term in text` for every term.
+    """
+    
+    def __init__(self, terms: Iterable[str]):
+        self.terms = tuple(dict.fromkeys(terms))
+        
+        # Longest term starting at each position, via a zero-width lookahead
+        longest_first = sorted(self.terms, key=len, reverse=True)
+        self._pattern = re.compile("(?=(" + "|".join(map(re.escape, longest_first)) + "))")
+        
+        # Every term contained in a matched term is present as well
+        self._contained = {
+            term: frozenset(other for other in self.terms if other in term)
+            for term in self.terms
+        }
+    
+    def find(self, text: str) -> Set[str]:
+        """Return the set of terms that occur in text."""
+        # findall collects the matches in C; closures are merged per distinct term
+        found = set()
+        for term in set(self._pattern.findall(text)):
+            found |= self._contained[term]
+        return found
+    
+    def count(self, text: str) -> int:
+        """Return how many distinct terms occur in text."""
+        return len(self.find(text))
+
+
+# Single-word/phrase indicators checked on their own
+TECHNICAL_EXTRA_TERMS = ("implementation", "design pattern")
+
+# Category membership sets, resolved against one fused scan of the summary
+TECHNICAL_TERM_SET = frozenset(TECHNICAL_TERMS)
+BUSINESS_TERM_SET = frozenset(BUSINESS_TERMS)
+DOMAIN_TERM_SET = frozenset(DOMAIN_TERMS)
+DOMAIN_TECHNICAL_TERM_SET = frozenset(DOMAIN_TECHNICAL_TERMS)
+STRATEGIC_TERM_SET = frozenset(STRATEGIC_TERMS)
+SECTION_TERM_SET = frozenset(SECTION_TERMS)
+LIST_MARKER_SET = frozenset(LIST_MARKERS)
+
+# One matcher over every summary-level keyword, so the summary is scanned once
+QUALITY_MATCHER = KeywordMatcher(
+    TECHNICAL_TERMS + TECHNICAL_EXTRA_TERMS + DOMAIN_TECHNICAL_TERMS + BUSINESS_TERMS +
+    DOMAIN_TERMS + STRATEGIC_TERMS + SECTION_TERMS + GENERIC_PHRASES +
+    HEADER_MARKERS + LIST_MARKERS
+)
+
+
+@lru_cache(maxsize=128)
+def _participant_pattern(participants: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile one alternation of the participant names worth looking for (longer than 3 chars)."""
+    names = [name for name in participants if len(name) > 3]
+    if not names:
+        return None
+    return re.compile("|".join(map(re.escape, names)))
+
+
+@lru_cache(maxsize=32)
+def _read_template(path: str, mtime_ns: int) -> str:
+    """Read a template file; cached per (path, mtime) so edits are picked up."""
+    with open(path, 'r') as f:
+        return f.read()
+
+
+def load_template(template_path: Path) -> Optional[str]:
+    """
+    Load a prompt template, reusing the cached text while the file is unchanged.
+    
+    Returns:
+        Template text, or None if the file doesn't exist.
+    """
+    path = os.path.abspath(template_path)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _read_template(path, mtime_ns)
+
+
+@add_slots
 @dataclass
 class QualityMetrics:
     """Quality assessment metrics for summaries."""
@@ -44,17 +169,24 @@ class QualityAssessor:
         try:
             metrics = QualityMetrics()
             
+            # Lowercase and split once, shared by all helpers
+            summary_lower = summary.lower()
+            lines_lower = summary_lower.split('\n')
+            
+            # One pass over the summary finds every keyword the helpers need
+            found_terms = QUALITY_MATCHER.find(summary_lower)
+            
             # Count technical terms
-            metrics.technical_terms_count = self._count_technical_terms(summary)
+            metrics.technical_terms_count = self._count_technical_terms(found_terms)
             
             # Count action items
-            metrics.action_items_count = self._count_action_items(summary)
+            metrics.action_items_count = self._count_action_items(lines_lower)
             
             # Assess business context
-            metrics.business_context_score = self._assess_business_context(summary, metadata)
+            metrics.business_context_score = self._assess_business_context(found_terms, metadata)
             
             # Assess clarity
-            metrics.clarity_score = self._assess_clarity(summary)
+            metrics.clarity_score = self._assess_clarity(summary, found_terms)
             
             # Calculate overall score
             metrics.overall_score = self._calculate_overall_score(metrics)
@@ -63,7 +195,7 @@ class QualityAssessor:
             metrics.confidence_level = self._determine_confidence(metrics, provider_used)
             
             # Identify quality issues
-            metrics.quality_issues = self._identify_quality_issues(summary, metrics, metadata)
+            metrics.quality_issues = self._identify_quality_issues(summary, found_terms, metrics, metadata)
             
             return metrics
             
@@ -75,94 +207,82 @@ class QualityAssessor:
                 quality_issues=["Quality assessment failed"]
             )
     
-    def _count_technical_terms(self, summary: str) -> int:
-        """Count technical terms in the summary."""
-        technical_indicators = [
-            "api", "service", "system", "architecture", "framework",
-            "database", "server", "client", "endpoint", "integration",
-            "deployment", "authentication", "authorization", "oauth",
-            "microservices", "rest", "graphql", "json", "xml",
-            "kubernetes", "docker", "aws", "azure", "gcp",
-            "python", "java", "javascript", "typescript", "react",
-            "node", "express", "spring", "django", "flask"
+    def assess_summary_quality_batch(self, summaries: List[str], metadatas: List[MeetingMetadata],
+                                     providers_used: List[str]) -> List[QualityMetrics]:
+        """Assess several summaries, e.g. the results of process_transcripts."""
+        if not len(summaries) == len(metadatas) == len(providers_used):
+            raise ValueError("summaries, metadatas and providers_used must have the same length")
+        
+        assess = self.assess_summary_quality
+        return [
+            assess(summary, metadata, provider_used)
+            for summary, metadata, provider_used in zip(summaries, metadatas, providers_used)
         ]
-        
-        summary_lower = summary.lower()
-        count = sum(1 for term in technical_indicators if term in summary_lower)
+    
+    def _count_technical_terms(self, found_terms: Set[str]) -> int:
+        """Count technical terms among the keywords found in the summary."""
+        count = len(found_terms & TECHNICAL_TERM_SET)
         
         # Look for specific patterns that indicate technical content
-        if "implementation" in summary_lower:
+        if "implementation" in found_terms:
             count += 1
-        if "design pattern" in summary_lower:
+        if "design pattern" in found_terms:
             count += 1
-        if any(word in summary_lower for word in ["multiplier", "cullinson", "booking"]):
+        if not DOMAIN_TECHNICAL_TERM_SET.isdisjoint(found_terms):
             count += 2  # Domain-specific technical terms
             
         return count
     
-    def _count_action_items(self, summary: str) -> int:
-        """Count action items in the summary."""
-        # Look for action item patterns
-        action_patterns = [
-            "- [ ]", "- [x]", "TODO:", "Action:", "Follow-up:",
-            "@" + "person", "Due:", "Timeline:", "Next step"
-        ]
-        
+    def _count_action_items(self, lines_lower: List[str]) -> int:
+        """Count action items in the (lowercased) summary lines."""
         count = 0
-        lines = summary.split('\n')
         
-        for line in lines:
-            line_lower = line.lower()
-            if any(pattern.lower() in line_lower for pattern in action_patterns):
+        for line_lower in lines_lower:
+            # Every action pattern contains ':', '[', '@' or "next step"
+            if ('@' not in line_lower and ':' not in line_lower and '[' not in line_lower
+                    and 'next step' not in line_lower):
+                continue
+            if any(pattern in line_lower for pattern in ACTION_PATTERNS_LOWER):
                 count += 1
             # Look for @mentions
-            if "@" in line and any(word in line_lower for word in ["due", "timeline", "task", "action"]):
+            if "@" in line_lower and any(word in line_lower for word in MENTION_TASK_WORDS):
                 count += 1
                 
         return count
     
-    def _assess_business_context(self, summary: str, metadata: MeetingMetadata) -> float:
+    def _assess_business_context(self, found_terms: Set[str], metadata: MeetingMetadata) -> float:
         """Assess how well the summary captures business context."""
-        summary_lower = summary.lower()
         score = 0.0
         
         # Check for business context indicators
-        business_indicators = [
-            "revenue", "customer", "product", "market", "business",
-            "strategy", "growth", "impact", "value", "roi",
-            "profit", "cost", "budget", "investment", "kpi"
-        ]
-        
-        found_indicators = sum(1 for term in business_indicators if term in summary_lower)
+        found_indicators = len(found_terms & BUSINESS_TERM_SET)
         score += min(found_indicators / 5.0, 1.0) * 0.4  # Up to 40% for business terms
         
         # Check for specific business context (domain-specific)
-        domain_terms = ["flights", "booking", "travel", "hotel", "ancillary"]
-        found_domain = sum(1 for term in domain_terms if term in summary_lower)
+        found_domain = len(found_terms & DOMAIN_TERM_SET)
         score += min(found_domain / 2.0, 1.0) * 0.3  # Up to 30% for domain context
         
         # Check for strategic elements
-        if any(word in summary_lower for word in ["strategy", "roadmap", "priority", "objective"]):
+        if not STRATEGIC_TERM_SET.isdisjoint(found_terms):
             score += 0.3  # 30% for strategic content
             
         return min(score, 1.0)
     
-    def _assess_clarity(self, summary: str) -> float:
+    def _assess_clarity(self, summary: str, found_terms: Set[str]) -> float:
         """Assess the clarity and structure of the summary."""
         score = 0.0
         
-        # Check for structured format
-        if "# " in summary or "## " in summary:
+        # Check for structured format (markers come from the fused scan)
+        if "# " in found_terms:
             score += 0.3  # 30% for headers
             
         # Check for bullet points or lists
-        if "- " in summary or "* " in summary:
+        if not LIST_MARKER_SET.isdisjoint(found_terms):
             score += 0.2  # 20% for lists
             
         # Check for clear sections
-        sections = ["business", "technical", "action", "decision", "challenge"]
-        found_sections = sum(1 for section in sections if section in summary.lower())
-        score += min(found_sections / len(sections), 1.0) * 0.3  # Up to 30% for sections
+        found_sections = len(found_terms & SECTION_TERM_SET)
+        score += min(found_sections / len(SECTION_TERMS), 1.0) * 0.3  # Up to 30% for sections
         
         # Check for appropriate length
         if 200 <= len(summary) <= 3000:
@@ -172,7 +292,11 @@ class QualityAssessor:
     
     def _calculate_overall_score(self, metrics: QualityMetrics) -> float:
         """Calculate overall quality score."""
-        config = self.config.quality.scoring
+        scoring = self.config.quality.scoring
+        technical_weight = scoring["technical_content"]
+        action_weight = scoring["action_items"]
+        business_weight = scoring["business_context"]
+        clarity_weight = scoring["clarity"]
         
         # Normalize scores
         tech_score = min(metrics.technical_terms_count / 5.0, 1.0)  # Expect ~5 technical terms
@@ -180,10 +304,10 @@ class QualityAssessor:
         
         # Weighted combination
         overall = (
-            tech_score * config["technical_content"] +
-            action_score * config["action_items"] +
-            metrics.business_context_score * config["business_context"] +
-            metrics.clarity_score * config["clarity"]
+            tech_score * technical_weight +
+            action_score * action_weight +
+            metrics.business_context_score * business_weight +
+            metrics.clarity_score * clarity_weight
         )
         
         return min(overall, 1.0)
@@ -199,35 +323,35 @@ class QualityAssessor:
         else:
             return "low"
     
-    def _identify_quality_issues(self, summary: str, metrics: QualityMetrics, metadata: MeetingMetadata) -> List[str]:
+    def _identify_quality_issues(self, summary: str, found_terms: Set[str], metrics: QualityMetrics,
+                                 metadata: MeetingMetadata) -> List[str]:
         """Identify specific quality issues."""
         issues = []
         
         # Check minimum requirements
-        config = self.config.quality
+        quality_config = self.config.quality
+        min_summary_length = quality_config.min_summary_length
+        min_technical_terms = quality_config.min_technical_terms
+        summary_length = len(summary)
+        technical_terms_count = metrics.technical_terms_count
         
-        if len(summary) < config.min_summary_length:
-            issues.append(f"Summary too short ({len(summary)} chars, minimum {config.min_summary_length})")
+        if summary_length < min_summary_length:
+            issues.append(f"Summary too short ({summary_length} chars, minimum {min_summary_length})")
         
-        if metrics.technical_terms_count < config.min_technical_terms:
-            issues.append(f"Insufficient technical content ({metrics.technical_terms_count} terms, minimum {config.min_technical_terms})")
+        if technical_terms_count < min_technical_terms:
+            issues.append(f"Insufficient technical content ({technical_terms_count} terms, minimum {min_technical_terms})")
         
-        if metrics.action_items_count < config.min_action_items:
+        if metrics.action_items_count < quality_config.min_action_items:
             issues.append(f"No clear action items identified")
         
         # Check for generic content
-        generic_phrases = [
-            "the team discussed", "improving collaboration", "better communication",
-            "working together", "moving forward", "next steps"
-        ]
-        
-        summary_lower = summary.lower()
-        found_generic = [phrase for phrase in generic_phrases if phrase in summary_lower]
+        found_generic = [phrase for phrase in GENERIC_PHRASES if phrase in found_terms]
         if found_generic:
             issues.append(f"Contains generic phrases: {', '.join(found_generic[:2])}")
         
         # Check for missing specific details
-        if not any(name in summary for name in metadata.participants if len(name) > 3):
+        participant_pattern = _participant_pattern(tuple(metadata.participants))
+        if participant_pattern is None or participant_pattern.search(summary) is None:
             issues.append("Missing specific participant references")
         
         return issues
@@ -263,48 +387,35 @@ class HybridAIProcessor:
             meeting_types = ['one_on_one', 'team_meeting', 'alignment', 'interview', 'all_hands']
             
             for meeting_type in meeting_types:
-                template_path = Path(f"config/prompts/{meeting_type}_template.txt")
-                if template_path.exists():
-                    with open(template_path, 'r') as f:
-                        self.meeting_type_templates[meeting_type] = f.read()
-                        self.logger.info(f"Loaded specialized template for {meeting_type}")
+                template = load_template(Path(f"config/prompts/{meeting_type}_template.txt"))
+                if template is not None:
+                    self.meeting_type_templates[meeting_type] = template
+                    self.logger.info(f"Loaded specialized template for {meeting_type}")
             
             # Load fallback concise template for meeting types without specialized templates
-            concise_template_path = Path("config/prompts/concise_summary_template.txt")
-            if concise_template_path.exists():
-                with open(concise_template_path, 'r') as f:
-                    concise_template = f.read()
-                    self.meeting_type_templates['fallback'] = concise_template
-                    self.logger.info("Loaded fallback concise template")
+            concise_template = load_template(Path("config/prompts/concise_summary_template.txt"))
+            if concise_template is not None:
+                self.meeting_type_templates['fallback'] = concise_template
+                self.logger.info("Loaded fallback concise template")
             
             # Load provider-specific templates (legacy support)
-            # Claude template
-            claude_template_path = Path("config/prompts/claude_summary_template.txt")
-            if claude_template_path.exists():
-                with open(claude_template_path, 'r') as f:
-                    self.prompt_templates['claude'] = f.read()
-            
-            # Enhanced Ollama template
-            ollama_template_path = Path("config/prompts/ollama_enhanced_template.txt")
-            if ollama_template_path.exists():
-                with open(ollama_template_path, 'r') as f:
-                    self.prompt_templates['ollama'] = f.read()
-            
-            # Entity extraction template
-            entity_template_path = Path("config/prompts/entity_extraction_template.txt")
-            if entity_template_path.exists():
-                with open(entity_template_path, 'r') as f:
-                    self.prompt_templates['entity_extraction'] = f.read()
+            provider_template_files = {
+                'claude': "config/prompts/claude_summary_template.txt",
+                'ollama': "config/prompts/ollama_enhanced_template.txt",
+                'entity_extraction': "config/prompts/entity_extraction_template.txt"
+            }
+            for template_key, template_file in provider_template_files.items():
+                template = load_template(Path(template_file))
+                if template is not None:
+                    self.prompt_templates[template_key] = template
             
             # Final fallback to original template
             if not self.prompt_templates and not self.meeting_type_templates:
-                fallback_path = Path("config/prompts/summary_template.txt")
-                if fallback_path.exists():
-                    with open(fallback_path, 'r') as f:
-                        template = f.read()
-                        self.prompt_templates['fallback'] = template
-                        self.prompt_templates['claude'] = template
-                        self.prompt_templates['ollama'] = template
+                template = load_template(Path("config/prompts/summary_template.txt"))
+                if template is not None:
+                    self.prompt_templates['fallback'] = template
+                    self.prompt_templates['claude'] = template
+                    self.prompt_templates['ollama'] = template
             
             self.logger.info(f"Loaded {len(self.prompt_templates)} provider templates and {len(self.meeting_type_templates)} meeting-type templates")
             
@@ -376,17 +487,16 @@ class HybridAIProcessor:
                 metadata=metadata,
                 processing_time=processing_time,
                 model_used=ai_response.model_used,
-                chunks_processed=getattr(ai_response, 'chunks_processed', 0)
+                chunks_processed=getattr(ai_response, 'chunks_processed', 0),
+                # Hybrid-specific metadata
+                ai_provider_used=ai_response.provider_used,
+                quality_metrics=quality_metrics,
+                processing_strategy="hybrid",
+                provider_processing_time=ai_response.processing_time,
+                tokens_used=ai_response.tokens_used,
+                provider_metadata=ai_response.metadata
             )
             
-            # Add hybrid-specific metadata
-            result.ai_provider_used = ai_response.provider_used
-            result.quality_metrics = quality_metrics
-            result.processing_strategy = "hybrid"
-            result.provider_processing_time = ai_response.processing_time
-            result.tokens_used = ai_response.tokens_used
-            result.provider_metadata = ai_response.metadata
-            
             # Log comprehensive metrics
             log_performance_metrics(
                 "hybrid_processing",
@@ -425,6 +535,39 @@ class HybridAIProcessor:
                 processing_time=processing_time
             )
     
+    async def process_transcripts(self, file_paths: List[Path],
+                                  max_workers: Optional[int] = None) -> List[ProcessingResult]:
+        """
+        Process several transcripts concurrently.
+        
+        Each transcript runs through process_transcript on a bounded thread pool,
+        so provider calls for different files overlap instead of queueing, and
+        parsing one file overlaps the provider calls already in flight for others.
+        
+        Args:
+            file_paths: Paths to the transcript files
+            max_workers: Pool size (defaults to performance.max_concurrent_files)
+            
+        Returns:
+            ProcessingResults in the same order as file_paths
+        """
+        if not file_paths:
+            return []
+        
+        workers = max_workers or self.config.performance.get('max_concurrent_files', 3)
+        workers = max(1, min(workers, len(file_paths)))
+        
+        self.logger.info(f"Processing {len(file_paths)} transcripts with {workers} workers")
+        
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = await asyncio.gather(*(
+                loop.run_in_executor(executor, self.process_transcript, file_path)
+                for file_path in file_paths
+            ))
+        
+        return list(results)
+    
     def _select_prompt_template(self, context: ProcessingContext) -> str:
         """Select the appropriate prompt template based on meeting type and context."""
         
@@ -513,11 +656,7 @@ class HybridAIProcessor:
             )
             
             # Get specific provider
-            provider = None
-            for p in self.ai_manager.providers:
-                if p.config.name == provider_name:
-                    provider = p
-                    break
+            provider = self.ai_manager.get_provider(provider_name)
             
             if not provider:
                 return ProcessingResult(
@@ -554,13 +693,12 @@ class HybridAIProcessor:
                 summary=ai_response.content,
                 metadata=metadata,
                 processing_time=ai_response.processing_time,
-                model_used=ai_response.model_used
+                model_used=ai_response.model_used,
+                ai_provider_used=provider_name,
+                quality_metrics=quality_metrics,
+                processing_strategy=f"manual_{provider_name}"
             )
             
-            result.ai_provider_used = provider_name
-            result.quality_metrics = quality_metrics
-            result.processing_strategy = f"manual_{provider_name}"
-            
             return result
             
         except Exception as e:
@@ -3,21 +3,28 @@ Pensieve Hybrid Processor - The Complete Integration
 Combines Universal Meeting Intelligence with Hybrid AI Processing for optimal results.
 """
 
+import asyncio
+import hashlib
 import os
+import threading
 import time
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Hashable
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property, lru_cache
 
 from .universal_meeting_analyzer import UniversalMeetingAnalyzer, MeetingAnalysis, MeetingType
 from .hybrid_ai_processor import HybridAIProcessor, QualityMetrics
-from .ai_processor import TranscriptParser, ProcessingResult, MeetingMetadata
+from .ai_processor import TranscriptParser, ProcessingResult, MeetingMetadata, add_slots
 from .ai_providers import AIProviderManager, ProcessingContext
-from ..utils.config import get_config
+from .transcript_preprocessor import TranscriptPreprocessor
+from ..utils.config import get_config, is_feature_enabled
 from ..utils.logger import get_logger, log_performance_metrics
 
 
+@add_slots
 @dataclass
 class HybridProcessingResult:
     """Enhanced processing result with intelligence metrics."""
@@ -32,12 +39,58 @@ class HybridProcessingResult:
     intelligence_boost: float = 0.0  # Improvement from universal intelligence
     error: Optional[str] = None
     recommendations: List[str] = None
+    preprocessing_stats: Optional[Dict[str, Any]] = None  # Set when the transcript was trimmed before the AI call
 
     def __post_init__(self):
         if self.recommendations is None:
             self.recommendations = []
 
 
+RECOMMENDATIONS = {
+    "low_quality": "Consider using Claude for better quality on complex meetings",
+    "no_action_items": "No action items detected - consider adding explicit follow-ups",
+    "low_technical": "Low technical content detected for technical meeting - verify classification",
+    "enable_claude": "Consider enabling Claude for higher quality summaries",
+}
+
+MEETING_TYPE_RECOMMENDATIONS = {
+    MeetingType.STRATEGY: "Strategy meeting: Ensure business metrics and KPIs are captured",
+    MeetingType.ONE_ON_ONE: "1:1 meeting: Consider privacy settings for sensitive discussions",
+    MeetingType.STANDUP: "Standup meeting: Track blockers and impediments for follow-up",
+}
+
+
+@lru_cache(maxsize=256)
+def _recommendations_for(meeting_type: MeetingType, quality_bucket: str, provider: str,
+                         zero_actions: bool, low_tech: bool) -> tuple:
+    """
+    Recommendations for one combination of processing outcomes.
+    
+    quality_bucket is "low" (score < 0.6), "mid" (< 0.7) or "high".
+    """
+    recommendations = []
+    
+    # Quality-based recommendations
+    if quality_bucket == "low":
+        recommendations.append(RECOMMENDATIONS["low_quality"])
+    
+    if zero_actions:
+        recommendations.append(RECOMMENDATIONS["no_action_items"])
+    
+    if low_tech and meeting_type == MeetingType.TECHNICAL:
+        recommendations.append(RECOMMENDATIONS["low_technical"])
+    
+    # Meeting-specific recommendations
+    if meeting_type in MEETING_TYPE_RECOMMENDATIONS:
+        recommendations.append(MEETING_TYPE_RECOMMENDATIONS[meeting_type])
+    
+    # Provider optimization recommendations
+    if provider == "ollama" and quality_bucket != "high":
+        recommendations.append(RECOMMENDATIONS["enable_claude"])
+    
+    return tuple(recommendations)
+
+
 class PensieveHybridProcessor:
     """
     The complete Pensieve system with Universal Intelligence + Hybrid AI.
@@ -49,81 +102,162 @@ class PensieveHybridProcessor:
     4. Assesses quality and provides recommendations
     """
     
+    # Entries kept per in-memory cache (analysis results, AI responses)
+    CACHE_SIZE = 64
+    # Seconds a meeting-type -> provider route is trusted before re-probing providers
+    ROUTE_TTL = 300.0
+    
     def __init__(self, config_path: Optional[str] = None):
         self.logger = get_logger("pensieve_hybrid")
         self.config = get_config()
         
-        # Initialize components
-        self.transcript_parser = TranscriptParser()
-        self.universal_analyzer = UniversalMeetingAnalyzer(config_path)
-        self.hybrid_processor = HybridAIProcessor()
-        self.ai_provider_manager = AIProviderManager()
+        # Components are created on first use (see the properties below), so
+        # read-only operations don't load configs or probe providers they never use
+        self._config_path = config_path
+        
+        # Trim filler and noise from long transcripts before sending them to a provider
+        self.preprocessing_enabled = is_feature_enabled('transcript_preprocessing')
         
         # Track performance metrics
         self.processing_stats = {
             "total_processed": 0,
             "claude_used": 0,
             "ollama_used": 0,
-            "avg_quality_score": 0.0,
-            "intelligence_improvements": 0
+            "quality_score_sum": 0.0,  # avg_quality_score is derived on read
+            "intelligence_improvements": 0,
+            "cache_hits": 0,
+            "cache_misses": 0
         }
+        self._stats_lock = threading.Lock()
+        
+        # In-memory caches for re-processing the same transcript (retries, regeneration)
+        self.cache_enabled = self.config.performance.get('cache_summaries', True)
+        self._analysis_cache: "OrderedDict[Hashable, MeetingAnalysis]" = OrderedDict()
+        self._response_cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # Provider choice depends only on meeting type and provider health, so it's
+        # routed once per type instead of probing every provider for every transcript
+        self._provider_routes: Dict[MeetingType, tuple] = {}
         
         self.logger.info("🧠 Pensieve Hybrid Processor initialized with Universal Intelligence")
-        self.logger.info(f"🤖 Available AI providers: {[provider.config.name for provider in self.ai_provider_manager.providers]}")
     
-    def process_transcript(self, file_path: Path) -> HybridProcessingResult:
+    @cached_property
+    def transcript_parser(self) -> TranscriptParser:
+        return TranscriptParser()
+    
+    @cached_property
+    def universal_analyzer(self) -> UniversalMeetingAnalyzer:
+        return UniversalMeetingAnalyzer(self._config_path)
+    
+    @cached_property
+    def hybrid_processor(self) -> HybridAIProcessor:
+        return HybridAIProcessor()
+    
+    @cached_property
+    def preprocessor(self) -> TranscriptPreprocessor:
+        return TranscriptPreprocessor()
+    
+    @cached_property
+    def ai_provider_manager(self) -> AIProviderManager:
+        manager = AIProviderManager()
+        self.logger.info("🤖 Available AI providers: %s",
+                         [provider.config.name for provider in manager.providers])
+        return manager
+    
+    def process_transcript(self, file_path: Path, force: bool = False,
+                           force_provider: Optional[str] = None) -> HybridProcessingResult:
         """
         Process a transcript with full hybrid intelligence.
         
         This is the main entry point that combines all Pensieve capabilities.
+        Unchanged transcripts reuse cached analysis and AI responses unless
+        force is set; force_provider skips routing and uses the named provider.
         """
         start_time = time.time()
         
         try:
-            self.logger.info(f"🚀 Starting hybrid processing: {file_path.name}")
+            self.logger.info("🚀 Starting hybrid processing: %s", file_path.name)
             
             # Step 1: Parse transcript and extract basic metadata
             transcript_content, basic_metadata = self.transcript_parser.parse_transcript(file_path)
             
+            use_cache = self.cache_enabled and not force
+            transcript_digest = self._digest(transcript_content)
+            
             # Step 2: Universal Meeting Analysis (detect type + context)
-            meeting_analysis = self.universal_analyzer.analyze_meeting(
-                transcript_content, 
-                {"file_path": str(file_path), "participants": basic_metadata.participants}
+            analysis_key = (transcript_digest, str(file_path), tuple(basic_metadata.participants))
+            meeting_analysis = self._cache_get(self._analysis_cache, analysis_key) if use_cache else None
+            if meeting_analysis is None:
+                meeting_analysis = self.universal_analyzer.analyze_meeting(
+                    transcript_content, 
+                    {"file_path": str(file_path), "participants": basic_metadata.participants}
+                )
+                if use_cache:
+                    self._cache_put(self._analysis_cache, analysis_key, meeting_analysis)
+            
+            # Step 3: Trim long transcripts for the AI call; analysis above uses the full text
+            preprocessing_stats = None
+            ai_transcript = transcript_content
+            if self.preprocessing_enabled and self.preprocessor.should_preprocess(transcript_content):
+                ai_transcript, preprocessing_stats = self.preprocessor.optimize_transcript(transcript_content)
+                self.logger.info("✂️ Preprocessed transcript: ~%d tokens saved (%.1f%% fewer words)",
+                                 preprocessing_stats['estimated_tokens_saved'],
+                                 preprocessing_stats['words_reduction_pct'])
+            
+            # Step 4: Get adaptive prompt from Universal Analyzer; providers append the transcript
+            adaptive_prompt = self.universal_analyzer.get_adaptive_prompt(
+                ai_transcript, analysis=meeting_analysis, include_transcript=False
             )
             
-            # Step 3: Create enhanced processing context
+            # Create enhanced processing context
             context = ProcessingContext(
                 meeting_title=basic_metadata.title,
                 meeting_date=basic_metadata.date,
                 participants=basic_metadata.participants,
                 meeting_type=meeting_analysis.meeting_type.value,
                 file_size=basic_metadata.file_size,
-                estimated_tokens=len(transcript_content) // 4  # Rough estimate
-            )
-            
-            # Step 4: Get adaptive prompt from Universal Analyzer
-            adaptive_prompt = self.universal_analyzer.get_adaptive_prompt(
-                transcript_content,
-                {"meeting_type": meeting_analysis.meeting_type.value}
+                # Rough transcript-only estimate; providers reserve their own room for prompt and response
+                estimated_tokens=len(ai_transcript) // 4
             )
             
             # Step 5: Select optimal AI provider based on meeting type and context
-            provider = self.ai_provider_manager.get_best_provider(context)
+            if force_provider:
+                provider = self.ai_provider_manager.get_provider(force_provider)
+                if not provider:
+                    return self._create_error_result(f"Provider {force_provider} not found", start_time)
+            else:
+                provider = self._route_provider(meeting_analysis.meeting_type, context)
             if not provider:
                 return self._create_error_result("No available AI provider", start_time)
             
-            self.logger.info(f"🎯 Meeting type detected: {meeting_analysis.meeting_type.value} "
-                           f"(confidence: {meeting_analysis.confidence:.2f})")
-            self.logger.info(f"🤖 Selected AI provider: {provider.config.name}")
+            self.logger.info("🎯 Meeting type detected: %s (confidence: %.2f)",
+                             meeting_analysis.meeting_type.value, meeting_analysis.confidence)
+            self.logger.info("🤖 Selected AI provider: %s", provider.config.name)
             
             # Step 6: Process with selected provider using adaptive prompt
-            ai_response = provider.generate_summary(adaptive_prompt, transcript_content, context)
+            # Keyed on the text actually sent, so toggling or changing preprocessing misses the cache
+            ai_digest = transcript_digest if ai_transcript is transcript_content else self._digest(ai_transcript)
+            response_key = (ai_digest, meeting_analysis.meeting_type.value,
+                            provider.config.name, self._digest(adaptive_prompt))
+            ai_response = self._cache_get(self._response_cache, response_key) if use_cache else None
+            
+            if ai_response is not None:
+                self.logger.info("♻️ Reusing cached %s response", provider.config.name)
+                self._record_cache_lookup(hit=True)
+            else:
+                if use_cache:
+                    self._record_cache_lookup(hit=False)
+                ai_response = provider.generate_summary(adaptive_prompt, ai_transcript, context)
+                if use_cache and ai_response.success:
+                    self._cache_put(self._response_cache, response_key, ai_response)
             
             if not ai_response.success:
-                # Fallback to different provider
-                self.logger.warning(f"Primary provider failed, attempting fallback...")
+                # Fallback to different provider, and re-probe providers next time
+                self.logger.warning("Primary provider failed, attempting fallback...")
+                self._provider_routes.pop(meeting_analysis.meeting_type, None)
                 ai_response = self.ai_provider_manager.process_with_fallback(
-                    adaptive_prompt, transcript_content, context
+                    adaptive_prompt, ai_transcript, context
                 )
             
             # Step 7: Quality assessment
@@ -157,9 +291,8 @@ class PensieveHybridProcessor:
                 intelligence_boost=intelligence_boost
             )
             
-            self.logger.info(f"✅ Processing complete in {processing_time:.1f}s "
-                           f"(Quality: {quality_metrics.overall_score:.2f}, "
-                           f"Boost: +{intelligence_boost:.1f}%)")
+            self.logger.info("✅ Processing complete in %.1fs (Quality: %.2f, Boost: +%.1f%%)",
+                             processing_time, quality_metrics.overall_score, intelligence_boost)
             
             return HybridProcessingResult(
                 success=True,
@@ -171,7 +304,8 @@ class PensieveHybridProcessor:
                 model_used=ai_response.model_used,
                 processing_time=processing_time,
                 intelligence_boost=intelligence_boost,
-                recommendations=recommendations
+                recommendations=recommendations,
+                preprocessing_stats=preprocessing_stats
             )
             
         except Exception as e:
@@ -183,6 +317,74 @@ class PensieveHybridProcessor:
             
             return self._create_error_result(error_msg, start_time)
     
+    async def aprocess_transcript(self, file_path: Path) -> HybridProcessingResult:
+        """Process a transcript without blocking the event loop."""
+        return await asyncio.to_thread(self.process_transcript, file_path)
+    
+    async def process_many(self, file_paths: List[Path],
+                           max_concurrency: Optional[int] = None) -> List[HybridProcessingResult]:
+        """
+        Process several transcripts concurrently.
+        
+        Provider calls for different files overlap, so a batch takes roughly as
+        long as its slowest transcripts rather than the sum of all of them. For
+        Ollama, set OLLAMA_NUM_PARALLEL on the server so requests aren't queued.
+        
+        Args:
+            file_paths: Paths to the transcript files
+            max_concurrency: Files in flight at once (defaults to performance.max_concurrent_files)
+            
+        Returns:
+            Results in the same order as file_paths
+        """
+        limit = max_concurrency or self.config.performance.get('max_concurrent_files', 3)
+        semaphore = asyncio.Semaphore(max(1, limit))
+        
+        async def process_one(file_path: Path) -> HybridProcessingResult:
+            async with semaphore:
+                return await self.aprocess_transcript(file_path)
+        
+        return list(await asyncio.gather(*(process_one(file_path) for file_path in file_paths)))
+    
+    def _route_provider(self, meeting_type: MeetingType, context: ProcessingContext):
+        """Get the provider for a meeting type, reusing a recent routing decision."""
+        route = self._provider_routes.get(meeting_type)
+        if route is not None:
+            provider, routed_at = route
+            if time.time() - routed_at < self.ROUTE_TTL:
+                return provider
+        
+        provider = self.ai_provider_manager.get_best_provider(context)
+        if provider:
+            self._provider_routes[meeting_type] = (provider, time.time())
+        return provider
+    
+    @staticmethod
+    def _digest(text: str) -> str:
+        """Stable fingerprint of a transcript or prompt for cache keys."""
+        return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+    
+    def _cache_get(self, cache: "OrderedDict[Hashable, Any]", key: Hashable) -> Optional[Any]:
+        """Look up a cache entry, marking it as recently used."""
+        with self._cache_lock:
+            value = cache.get(key)
+            if value is not None:
+                cache.move_to_end(key)
+            return value
+    
+    def _cache_put(self, cache: "OrderedDict[Hashable, Any]", key: Hashable, value: Any) -> None:
+        """Store a cache entry, evicting the least recently used beyond the size limit."""
+        with self._cache_lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > self.CACHE_SIZE:
+                cache.popitem(last=False)
+    
+    def _record_cache_lookup(self, hit: bool) -> None:
+        """Count a response-cache hit or miss."""
+        with self._stats_lock:
+            self.processing_stats["cache_hits" if hit else "cache_misses"] += 1
+    
     def _calculate_intelligence_boost(self, analysis: MeetingAnalysis, 
                                     quality: QualityMetrics, provider: str) -> float:
         """Calculate the intelligence boost from universal analysis."""
@@ -215,50 +417,31 @@ class PensieveHybridProcessor:
     def _generate_recommendations(self, analysis: MeetingAnalysis, 
                                 quality: QualityMetrics, ai_response) -> List[str]:
         """Generate actionable recommendations based on processing results."""
-        recommendations = []
-        
-        # Quality-based recommendations
-        if quality.overall_score < 0.6:
-            recommendations.append("Consider using Claude for better quality on complex meetings")
-        
-        if quality.action_items_count == 0:
-            recommendations.append("No action items detected - consider adding explicit follow-ups")
-        
-        if quality.technical_terms_count < 3 and analysis.meeting_type == MeetingType.TECHNICAL:
-            recommendations.append("Low technical content detected for technical meeting - verify classification")
-        
-        # Meeting-specific recommendations
-        if analysis.meeting_type == MeetingType.STRATEGY:
-            recommendations.append("Strategy meeting: Ensure business metrics and KPIs are captured")
-        
-        if analysis.meeting_type == MeetingType.ONE_ON_ONE:
-            recommendations.append("1:1 meeting: Consider privacy settings for sensitive discussions")
-        
-        if analysis.meeting_type == MeetingType.STANDUP:
-            recommendations.append("Standup meeting: Track blockers and impediments for follow-up")
-        
-        # Provider optimization recommendations
-        if ai_response.provider_used == "ollama" and quality.overall_score < 0.7:
-            recommendations.append("Consider enabling Claude for higher quality summaries")
-        
-        return recommendations
+        score = quality.overall_score
+        quality_bucket = "low" if score < 0.6 else "mid" if score < 0.7 else "high"
+        return list(_recommendations_for(
+            analysis.meeting_type,
+            quality_bucket,
+            ai_response.provider_used,
+            quality.action_items_count == 0,
+            quality.technical_terms_count < 3
+        ))
     
     def _update_stats(self, provider_used: str, quality_score: float, intelligence_boost: float):
         """Update processing statistics."""
-        self.processing_stats["total_processed"] += 1
-        
-        if provider_used == "claude":
-            self.processing_stats["claude_used"] += 1
-        elif provider_used == "ollama":
-            self.processing_stats["ollama_used"] += 1
-        
-        # Update rolling average quality score
-        total = self.processing_stats["total_processed"]
-        current_avg = self.processing_stats["avg_quality_score"]
-        self.processing_stats["avg_quality_score"] = ((current_avg * (total - 1)) + quality_score) / total
-        
-        if intelligence_boost > 10.0:
-            self.processing_stats["intelligence_improvements"] += 1
+        # process_many runs transcripts on worker threads
+        with self._stats_lock:
+            self.processing_stats["total_processed"] += 1
+            
+            if provider_used == "claude":
+                self.processing_stats["claude_used"] += 1
+            elif provider_used == "ollama":
+                self.processing_stats["ollama_used"] += 1
+            
+            self.processing_stats["quality_score_sum"] += quality_score
+            
+            if intelligence_boost > 10.0:
+                self.processing_stats["intelligence_improvements"] += 1
     
     def _create_error_result(self, error_msg: str, start_time: float) -> HybridProcessingResult:
         """Create an error result."""
@@ -270,7 +453,9 @@ class PensieveHybridProcessor:
     
     def get_processing_stats(self) -> Dict[str, Any]:
         """Get current processing statistics."""
-        stats = self.processing_stats.copy()
+        with self._stats_lock:
+            stats = self.processing_stats.copy()
+        stats["avg_quality_score"] = stats.pop("quality_score_sum") / max(1, stats["total_processed"])
         
         # Add provider availability - providers is a list, not a dict
         stats["available_providers"] = [provider.config.name for provider in self.ai_provider_manager.providers]
@@ -280,24 +465,16 @@ class PensieveHybridProcessor:
     
     def regenerate_with_provider(self, file_path: Path, provider_name: str) -> HybridProcessingResult:
         """Regenerate a summary using a specific provider."""
-        # Temporarily override provider selection for this request
-        original_config = self.config.copy()
+        self.logger.info(f"🔄 Regenerating with {provider_name} provider...")
         
-        try:
-            # Force specific provider
-            self.logger.info(f"🔄 Regenerating with {provider_name} provider...")
-            
-            # Process with forced provider (implementation depends on provider manager)
-            result = self.process_transcript(file_path)
-            
-            if result.ai_provider_used != provider_name:
-                self.logger.warning(f"Requested {provider_name} but used {result.ai_provider_used}")
-            
-            return result
-            
-        finally:
-            # Restore original config
-            self.config = original_config
+        # Force the provider for this request only, and bypass the cache so a
+        # fresh summary is generated
+        result = self.process_transcript(file_path, force=True, force_provider=provider_name)
+        
+        if result.success and result.ai_provider_used != provider_name:
+            self.logger.warning(f"Requested {provider_name} but used {result.ai_provider_used}")
+        
+        return result
 
 
 def create_pensieve_processor(config_path: Optional[str] = None) -> PensieveHybridProcessor:
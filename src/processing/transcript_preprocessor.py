@@ -4,9 +4,36 @@ Transcript preprocessor to reduce token usage and costs.
 Removes filler words, repetitive content, and non-essential parts.
 """
 
+import hashlib
 import re
 from typing import List, Tuple
 
+def _first_char_class(patterns: List[str]) -> str:
+    """
+    Build a character class of the characters the patterns can start with.
+    
+    Each pattern must start with a required \\d, escaped punctuation character
+    or literal letter or digit (letters match in either case) and contain no
+    alternation; anything else raises ValueError rather than producing a class
+    that misses it.
+    """
+    chars = []
+    for pattern in patterns:
+        if pattern.startswith(r'\d'):
+            first, rest = r'\d', pattern[2:]
+        elif len(pattern) > 1 and pattern[0] == '\\' and not pattern[1].isalnum():
+            first, rest = re.escape(pattern[1]), pattern[2:]
+        elif pattern[:1].isalnum():
+            first, rest = pattern[0].lower() + pattern[0].upper(), pattern[1:]
+        else:
+            first = rest = None
+        
+        optional_first = rest is not None and rest.startswith(('?', '*', '{0', '{,'))
+        if first is None or optional_first or '|' in pattern:
+            raise ValueError(f"Cannot determine the first character of noise pattern {pattern!r}")
+        chars.append(first)
+    return '[' + ''.join(dict.fromkeys(chars)) + ']'
+
 class TranscriptPreprocessor:
     """Optimizes transcripts to reduce token usage while preserving meaning."""
     
@@ -31,6 +58,18 @@ class TranscriptPreprocessor:
             r'\[pause\]',
             r'\[silence\]'
         ]
+        
+        # Compile once; the helpers below run on every transcript. The lookahead
+        # lists the characters a noise pattern can start with, so the scan skips
+        # other positions without trying each case-insensitive branch
+        self._zoom_regex = re.compile(
+            '(?=' + _first_char_class(self.zoom_patterns) + ')(?i:'
+            + '|'.join(f'(?:{pattern})' for pattern in self.zoom_patterns)
+            + ')'
+        )
+        self._re_sentence_split = re.compile(r'[.!?]+')
+        self._re_space_before_punct = re.compile(r'\s+([.,:;!?])')
+        self._re_sentence_start = re.compile(r'([.!?])\s*([A-Z])')
     
     def optimize_transcript(self, transcript: str) -> Tuple[str, dict]:
         """
@@ -49,12 +88,15 @@ class TranscriptPreprocessor:
         # Step 3: Consolidate repetitive statements
         cleaned = self._consolidate_repetition(cleaned)
         
-        # Step 4: Remove excessive whitespace and formatting
-        cleaned = self._normalize_whitespace(cleaned)
+        # Step 4: Clean up formatting. Step 2 already collapsed all whitespace to
+        # single spaces, so only the punctuation passes of _normalize_whitespace remain
+        cleaned = self._normalize_punctuation(cleaned)
         
         # Calculate savings
         optimized_length = len(cleaned)
-        optimized_words = len(cleaned.split())
+        # Normalized text is stripped and single-space separated, so counting
+        # separators gives the exact word count without building a word list
+        optimized_words = cleaned.count(' ') + 1 if cleaned else 0
         
         stats = {
             'original_chars': original_length,
@@ -71,31 +113,25 @@ class TranscriptPreprocessor:
         return cleaned, stats
     
     def _remove_zoom_noise(self, text: str) -> str:
-        """Remove Zoom-specific noise patterns."""
-        for pattern in self.zoom_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        return text
+        """Remove Zoom-specific noise patterns in a single pass."""
+        return self._zoom_regex.sub('', text)
     
     def _reduce_filler_words(self, text: str) -> str:
         """
         Reduce (but don't eliminate) filler words.
         Keep some for natural flow, remove excessive usage.
         """
-        words = text.split()
+        filler_words = self.filler_words
         cleaned_words = []
-        consecutive_fillers = 0
+        append = cleaned_words.append
+        previous_was_filler = False
         
-        for word in words:
-            word_clean = word.lower().strip('.,!?')
-            
-            if word_clean in self.filler_words:
-                consecutive_fillers += 1
-                # Keep first filler in a sequence, skip excessive ones
-                if consecutive_fillers <= 1:
-                    cleaned_words.append(word)
-            else:
-                consecutive_fillers = 0
-                cleaned_words.append(word)
+        for word in text.split():
+            is_filler = word.lower().strip('.,!?') in filler_words
+            # Keep first filler in a sequence, skip excessive ones
+            if not (is_filler and previous_was_filler):
+                append(word)
+            previous_was_filler = is_filler
         
         return ' '.join(cleaned_words)
     
@@ -104,47 +140,49 @@ class TranscriptPreprocessor:
         Identify and consolidate repetitive statements.
         Common in meetings where people repeat points.
         """
-        sentences = re.split(r'[.!?]+', text)
+        sentences = self._re_sentence_split.split(text)
         
         # Simple repetition detection - if same sentence appears multiple times
         seen_sentences = {}
         consolidated = []
+        append = consolidated.append
+        blake2b = hashlib.blake2b
         
         for sentence in sentences:
             sentence = sentence.strip()
             if len(sentence) < 10:  # Skip very short fragments
-                consolidated.append(sentence)
+                append(sentence)
                 continue
             
-            # Normalize for comparison (lowercase, remove minor variations)
-            normalized = re.sub(r'\s+', ' ', sentence.lower())
+            # Normalize for comparison (lowercase, remove minor variations);
+            # keep only a 64-bit digest so the table doesn't hold every sentence
+            normalized = ' '.join(sentence.lower().split())
+            key = blake2b(normalized.encode('utf-8', 'surrogatepass'), digest_size=8).digest()
             
-            if normalized in seen_sentences:
-                seen_sentences[normalized] += 1
-                # Skip if we've seen this exact point more than twice
-                if seen_sentences[normalized] <= 2:
-                    consolidated.append(sentence)
-            else:
-                seen_sentences[normalized] = 1
-                consolidated.append(sentence)
+            # Skip if we've seen this exact point more than twice
+            seen_count = seen_sentences.get(key, 0) + 1
+            seen_sentences[key] = seen_count
+            if seen_count <= 2:
+                append(sentence)
         
         return '. '.join(filter(None, consolidated))
     
     def _normalize_whitespace(self, text: str) -> str:
         """Clean up excessive whitespace and formatting."""
-        # Replace multiple spaces with single space
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove excessive line breaks
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+        # Replace multiple spaces with single space (this also removes every
+        # line break, so no separate blank-line pass is needed)
+        text = ' '.join(text.split())
         
-        # Clean up around punctuation
-        text = re.sub(r'\s+([.,:;!?])', r'\1', text)
-        text = re.sub(r'([.!?])\s*([A-Z])', r'\1 \2', text)
+        return self._normalize_punctuation(text)
+    
+    def _normalize_punctuation(self, text: str) -> str:
+        """Clean up spacing around punctuation."""
+        text = self._re_space_before_punct.sub(r'\1', text)
+        text = self._re_sentence_start.sub(r'\1 \2', text)
         
         return text.strip()
     
     def should_preprocess(self, transcript: str, threshold_words: int = 3000) -> bool:
         """Determine if transcript should be preprocessed based on size."""
-        word_count = len(transcript.split())
-        return word_count > threshold_words 
\ No newline at end of file
+        # Splitting stops after threshold_words, so long transcripts aren't fully tokenized
+        return len(transcript.split(None, threshold_words)) > threshold_words 
\ No newline at end of file
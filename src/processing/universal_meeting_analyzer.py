@@ -3,11 +3,18 @@ Universal Meeting Intelligence System
 Implements adaptive meeting analysis with automatic type detection and content-adaptive extraction.
 """
 
+import hashlib
+import os
 import re
 import logging
+import threading
+from collections import OrderedDict
 from enum import Enum
+from functools import lru_cache
+from string import Formatter
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Tuple, Hashable, Mapping
 from datetime import datetime
 import yaml
 
@@ -21,6 +28,10 @@ class MeetingType(Enum):
     ONE_ON_ONE = "one_on_one"
     STANDUP = "standup"
     GENERAL_SYNC = "general_sync"
+    
+    # Members are singletons compared by identity, so hash by identity too; Enum's
+    # default hashes the member name in Python code on every dict lookup
+    __hash__ = object.__hash__
 
 @dataclass
 class MeetingContext:
@@ -46,81 +57,156 @@ class MeetingAnalysis:
     context: MeetingContext
     quality_indicators: Dict[str, Any]
 
+# Keyword and phrase signals per meeting type (matched against the lowercased transcript)
+MEETING_TYPE_PATTERNS = MappingProxyType({
+    MeetingType.TECHNICAL: MappingProxyType({
+        'keywords': ('architecture', 'api', 'system', 'service', 'database', 'deployment', 
+                   'code', 'implementation', 'technical', 'integration', 'infrastructure',
+                   'backend', 'frontend', 'microservice', 'repository', 'framework'),
+        'phrases': ('system design', 'code review', 'technical decision', 'api design',
+                  'architecture decision', 'technical debt', 'performance issue')
+    }),
+    MeetingType.STRATEGY: MappingProxyType({
+        'keywords': ('roadmap', 'strategy', 'planning', 'objectives', 'goals', 'business',
+                   'priorities', 'vision', 'direction', 'budget', 'resources', 'timeline',
+                   'milestone', 'deliverable', 'quarter', 'okr', 'q1', 'q2', 'q3', 'q4',
+                   'allocate', 'prioritize', 'market', 'opportunity', 'initiative'),
+        'phrases': ('business goals', 'strategic direction', 'product roadmap', 'quarterly planning',
+                  'business case', 'market opportunity', 'resource allocation', 'business objectives',
+                  'key objectives', 'business decisions', 'strategic decisions')
+    }),
+    MeetingType.ALIGNMENT: MappingProxyType({
+        'keywords': ('coordination', 'sync', 'dependencies', 'blockers', 'teams', 'alignment',
+                   'handoff', 'collaboration', 'communication', 'update', 'status',
+                   'cross-team', 'integration', 'workflow', 'coordinate', 'blocked'),
+        'phrases': ('cross-team', 'team coordination', 'sync up', 'alignment meeting',
+                  'dependency management', 'team sync', 'better coordination', 'need alignment',
+                  'communication protocols', 'handoff process')
+    }),
+    MeetingType.ONE_ON_ONE: MappingProxyType({
+        'keywords': ('career', 'feedback', 'development', 'performance', 'personal', 'growth',
+                   'promotion', 'goals', 'coaching', 'mentoring', 'review', 'one-on-one',
+                   'individual', 'pdp', 'feeling', 'opportunities', 'skills'),
+        'phrases': ('career development', 'performance review', 'personal goals', '1:1',
+                  'career path', 'professional development', 'how are you feeling',
+                  'leadership opportunities', 'growth opportunity', 'promotion track')
+    }),
+    MeetingType.STANDUP: MappingProxyType({
+        'keywords': ('yesterday', 'today', 'tomorrow', 'blocked', 'blocker', 'status',
+                   'progress', 'standup', 'daily', 'scrum', 'sprint', 'working on',
+                   'completed', 'next', 'stuck', 'finished', 'focusing'),
+        'phrases': ('daily standup', 'what I worked on', 'what I\'m working on', 
+                  'blockers', 'yesterday I', 'today I will', 'I worked on', 'I completed',
+                  'I\'m focusing on', 'I finished', 'help with')
+    })
+})
+
+# Booking.com teams, roles and business terms used for context boosts
+BOOKING_CONTEXT = MappingProxyType({
+    'teams': ('flights', 'accommodations', 'attractions', 'ground transport', 'payments',
+             'user experience', 'platform', 'data', 'mobile', 'web'),
+    'roles': MappingProxyType({'em': 'Engineering Manager', 'pm': 'Product Manager', 'tl': 'Tech Lead',
+             'swe': 'Software Engineer', 'ds': 'Data Scientist', 'ux': 'UX Designer'}),
+    'business_terms': ('supplier', 'booking flow', 'conversion', 'user journey',
+                     'inventory', 'pricing', 'search', 'recommendations')
+})
+
+# Team names as whole words, so "data" matches "Data Sync" but not "Database Review"
+TEAM_PATTERN = re.compile(r'\b(' + '|'.join(map(re.escape, BOOKING_CONTEXT['teams'])) + r')\b', re.IGNORECASE)
+
+# Role abbreviations as whole words, so "em" matches "John (EM)" but not "emily@..."
+ROLE_PATTERN = re.compile(r'\b(' + '|'.join(map(re.escape, BOOKING_CONTEXT['roles'])) + r')\b')
+
+# Title words (matched as lowercase substrings) that boost a meeting type, and by how much
+TITLE_BOOSTS = MappingProxyType({
+    meeting_type: (re.compile('|'.join(map(re.escape, words))), weight)
+    for meeting_type, words, weight in (
+        (MeetingType.STANDUP, ('standup', 'daily', 'scrum'), 0.5),
+        (MeetingType.ONE_ON_ONE, ('1:1', 'one-on-one', 'career'), 0.5),
+        (MeetingType.TECHNICAL, ('architecture', 'technical', 'design', 'review'), 0.3),
+        (MeetingType.STRATEGY, ('strategy', 'planning', 'roadmap'), 0.3),
+    )
+})
+
+# Participant counts (inclusive range) that boost a meeting type, and by how much
+PARTICIPANT_COUNT_BOOSTS = MappingProxyType({
+    MeetingType.ONE_ON_ONE: (2, 2, 0.3),
+    MeetingType.STANDUP: (3, 8, 0.2),
+    MeetingType.ALIGNMENT: (9, float('inf'), 0.2),
+})
+
+# Time of day (and day of week, if it matters) that boost a meeting type, and by how much
+TIME_BOOSTS = MappingProxyType({
+    MeetingType.STANDUP: ('morning', None, 0.2),
+    MeetingType.ONE_ON_ONE: ('afternoon', 'friday', 0.2),
+})
+
+# Per meeting type: Booking.com teams worth 0.1 each when mentioned, and the boost per
+# business term mentioned
+BOOKING_BOOSTS = MappingProxyType({
+    MeetingType.TECHNICAL: (('platform', 'data'), 0.03),
+    MeetingType.STRATEGY: (('flights', 'accommodations'), 0.05),
+})
+
+def _build_term_weights() -> Dict[str, Tuple[Tuple[MeetingType, float], ...]]:
+    """
+    Map each distinct keyword/phrase to its weight per meeting type.
+    
+    A keyword listing is worth 0.5 and a phrase listing 1.0; terms listed for
+    several types (or as both keyword and phrase) are counted once and credited
+    to each.
+    """
+    term_weights: Dict[str, Dict[MeetingType, float]] = {}
+    for meeting_type, patterns in MEETING_TYPE_PATTERNS.items():
+        for terms, weight in ((patterns['keywords'], 0.5), (patterns['phrases'], 1.0)):
+            for term in terms:
+                type_weights = term_weights.setdefault(term, {})
+                type_weights[meeting_type] = type_weights.get(meeting_type, 0.0) + weight
+    return {term: tuple(type_weights.items()) for term, type_weights in term_weights.items()}
+
+# Built once at import; every detector shares them
+TERM_WEIGHTS = MappingProxyType(_build_term_weights())
+
+# Distinct terms whose occurrences in the transcript feed detection
+DETECTION_TERMS = tuple(dict.fromkeys(
+    tuple(TERM_WEIGHTS) + BOOKING_CONTEXT['teams'] + BOOKING_CONTEXT['business_terms']
+))
+
 class MeetingTypeDetector:
     """Detects meeting type from content and metadata"""
     
+    # Transcripts whose term counts are kept, so re-analysing one (with the same or
+    # different metadata) skips lowercasing and scanning it again
+    CACHE_SIZE = 256
+    
     def __init__(self):
-        self.patterns = {
-            MeetingType.TECHNICAL: {
-                'keywords': ['architecture', 'api', 'system', 'service', 'database', 'deployment', 
-                           'code', 'implementation', 'technical', 'integration', 'infrastructure',
-                           'backend', 'frontend', 'microservice', 'repository', 'framework'],
-                'phrases': ['system design', 'code review', 'technical decision', 'api design',
-                          'architecture decision', 'technical debt', 'performance issue']
-            },
-            MeetingType.STRATEGY: {
-                'keywords': ['roadmap', 'strategy', 'planning', 'objectives', 'goals', 'business',
-                           'priorities', 'vision', 'direction', 'budget', 'resources', 'timeline',
-                           'milestone', 'deliverable', 'quarter', 'okr', 'q1', 'q2', 'q3', 'q4',
-                           'allocate', 'prioritize', 'market', 'opportunity', 'initiative'],
-                'phrases': ['business goals', 'strategic direction', 'product roadmap', 'quarterly planning',
-                          'business case', 'market opportunity', 'resource allocation', 'business objectives',
-                          'key objectives', 'business decisions', 'strategic decisions']
-            },
-            MeetingType.ALIGNMENT: {
-                'keywords': ['coordination', 'sync', 'dependencies', 'blockers', 'teams', 'alignment',
-                           'handoff', 'collaboration', 'communication', 'update', 'status',
-                           'cross-team', 'integration', 'workflow', 'coordinate', 'blocked'],
-                'phrases': ['cross-team', 'team coordination', 'sync up', 'alignment meeting',
-                          'dependency management', 'team sync', 'better coordination', 'need alignment',
-                          'communication protocols', 'handoff process']
-            },
-            MeetingType.ONE_ON_ONE: {
-                'keywords': ['career', 'feedback', 'development', 'performance', 'personal', 'growth',
-                           'promotion', 'goals', 'coaching', 'mentoring', 'review', 'one-on-one',
-                           'individual', 'pdp', 'feeling', 'opportunities', 'skills'],
-                'phrases': ['career development', 'performance review', 'personal goals', '1:1',
-                          'career path', 'professional development', 'how are you feeling',
-                          'leadership opportunities', 'growth opportunity', 'promotion track']
-            },
-            MeetingType.STANDUP: {
-                'keywords': ['yesterday', 'today', 'tomorrow', 'blocked', 'blocker', 'status',
-                           'progress', 'standup', 'daily', 'scrum', 'sprint', 'working on',
-                           'completed', 'next', 'stuck', 'finished', 'focusing'],
-                'phrases': ['daily standup', 'what I worked on', 'what I\'m working on', 
-                          'blockers', 'yesterday I', 'today I will', 'I worked on', 'I completed',
-                          'I\'m focusing on', 'I finished', 'help with']
-            }
-        }
+        self.patterns = MEETING_TYPE_PATTERNS
+        self.booking_context = BOOKING_CONTEXT
         
-        self.booking_context = {
-            'teams': ['flights', 'accommodations', 'attractions', 'ground transport', 'payments',
-                     'user experience', 'platform', 'data', 'mobile', 'web'],
-            'roles': {'em': 'Engineering Manager', 'pm': 'Product Manager', 'tl': 'Tech Lead',
-                     'swe': 'Software Engineer', 'ds': 'Data Scientist', 'ux': 'UX Designer'},
-            'business_terms': ['supplier', 'booking flow', 'conversion', 'user journey',
-                             'inventory', 'pricing', 'search', 'recommendations']
-        }
+        self._term_counts_cache: "OrderedDict[Hashable, Dict[str, int]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def detect_meeting_type(self, transcript: str, context: MeetingContext) -> Tuple[MeetingType, float]:
         """
         Detect meeting type from transcript content and metadata context
         Returns (MeetingType, confidence_score)
         """
-        # Normalize transcript for analysis
-        content_lower = transcript.lower()
+        # Scan the transcript once; all scores and boosts are derived from the counts,
+        # and only the metadata boost depends on the context
+        term_counts = self._cached_term_counts(transcript)
         
         # Calculate scores for each meeting type
         type_scores = {}
+        content_scores = self._calculate_content_scores(term_counts)
         
-        for meeting_type, patterns in self.patterns.items():
-            score = self._calculate_content_score(content_lower, patterns)
+        for meeting_type in self.patterns:
+            score = content_scores[meeting_type]
             
             # Apply metadata boost
             metadata_boost = self._calculate_metadata_boost(meeting_type, context)
             
             # Apply Booking.com context boost
-            booking_boost = self._calculate_booking_boost(content_lower, meeting_type)
+            booking_boost = self._calculate_booking_boost(term_counts, meeting_type)
             
             final_score = score * (1 + metadata_boost + booking_boost)
             type_scores[meeting_type] = final_score
@@ -142,88 +228,96 @@ class MeetingTypeDetector:
             
         return best_type, confidence
 
-    def _calculate_content_score(self, content: str, patterns: Dict[str, List[str]]) -> float:
-        """Calculate score based on keyword and phrase matches"""
-        score = 0.0
+    def _cached_term_counts(self, transcript: str) -> Dict[str, int]:
+        """Term counts of a transcript, reusing them if it was scanned recently"""
+        key = hashlib.blake2b(transcript.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        with self._cache_lock:
+            term_counts = self._term_counts_cache.get(key)
+            if term_counts is not None:
+                self._term_counts_cache.move_to_end(key)
+                return term_counts
         
-        # Keyword scoring with higher weights
-        for keyword in patterns['keywords']:
-            count = content.count(keyword)
-            score += count * 0.5  # Increased from 0.1 to 0.5
-            
-        # Phrase scoring (much higher weight)
-        for phrase in patterns['phrases']:
-            count = content.count(phrase)
-            score += count * 1.0  # Increased from 0.3 to 1.0
-            
-        return score
+        # Normalize transcript for analysis
+        term_counts = self._count_terms(transcript.lower())
+        
+        with self._cache_lock:
+            self._term_counts_cache[key] = term_counts
+            while len(self._term_counts_cache) > self.CACHE_SIZE:
+                self._term_counts_cache.popitem(last=False)
+        return term_counts
+
+    def _count_terms(self, content: str) -> Dict[str, int]:
+        """Count occurrences of every distinct detection term once (terms not found are omitted)"""
+        counts = {}
+        for term in DETECTION_TERMS:
+            count = content.count(term)
+            if count:
+                counts[term] = count
+        return counts
+
+    def _calculate_content_scores(self, term_counts: Dict[str, int]) -> Dict[MeetingType, float]:
+        """Calculate the keyword and phrase score of every meeting type from term counts"""
+        scores = dict.fromkeys(self.patterns, 0.0)
+        for term, count in term_counts.items():
+            for meeting_type, weight in TERM_WEIGHTS.get(term, ()):
+                scores[meeting_type] += count * weight
+        return scores
 
     def _calculate_metadata_boost(self, meeting_type: MeetingType, context: MeetingContext) -> float:
         """Calculate score boost based on meeting metadata"""
         boost = 0.0
         
         # Title-based detection
-        if context.title:
-            title_lower = context.title.lower()
-            if meeting_type == MeetingType.STANDUP and any(word in title_lower for word in ['standup', 'daily', 'scrum']):
-                boost += 0.5
-            elif meeting_type == MeetingType.ONE_ON_ONE and any(word in title_lower for word in ['1:1', 'one-on-one', 'career']):
-                boost += 0.5
-            elif meeting_type == MeetingType.TECHNICAL and any(word in title_lower for word in ['architecture', 'technical', 'design', 'review']):
-                boost += 0.3
-            elif meeting_type == MeetingType.STRATEGY and any(word in title_lower for word in ['strategy', 'planning', 'roadmap']):
-                boost += 0.3
+        title_boost = TITLE_BOOSTS.get(meeting_type)
+        if context.title and title_boost:
+            title_pattern, title_weight = title_boost
+            if title_pattern.search(context.title.lower()):
+                boost += title_weight
         
         # Participant count heuristics
-        if context.participants:
-            participant_count = len(context.participants)
-            if meeting_type == MeetingType.ONE_ON_ONE and participant_count == 2:
-                boost += 0.3
-            elif meeting_type == MeetingType.STANDUP and 3 <= participant_count <= 8:
-                boost += 0.2
-            elif meeting_type == MeetingType.ALIGNMENT and participant_count > 8:
-                boost += 0.2
+        participant_boost = PARTICIPANT_COUNT_BOOSTS.get(meeting_type)
+        if context.participants and participant_boost:
+            min_count, max_count, participant_weight = participant_boost
+            if min_count <= len(context.participants) <= max_count:
+                boost += participant_weight
         
         # Time-based heuristics
-        if context.time_of_day:
-            if meeting_type == MeetingType.STANDUP and context.time_of_day in ['morning']:
-                boost += 0.2
-            elif meeting_type == MeetingType.ONE_ON_ONE and context.time_of_day in ['afternoon'] and context.day_of_week == 'friday':
-                boost += 0.2
+        time_boost = TIME_BOOSTS.get(meeting_type)
+        if context.time_of_day and time_boost:
+            time_of_day, day_of_week, time_weight = time_boost
+            if context.time_of_day == time_of_day and day_of_week in (None, context.day_of_week):
+                boost += time_weight
                 
         return boost
 
-    def _calculate_booking_boost(self, content: str, meeting_type: MeetingType) -> float:
+    def _calculate_booking_boost(self, term_counts: Dict[str, int], meeting_type: MeetingType) -> float:
         """Calculate score boost based on Booking.com specific context"""
         boost = 0.0
         
+        booking_boost = BOOKING_BOOSTS.get(meeting_type)
+        if booking_boost is None:
+            return boost
+        teams, business_term_weight = booking_boost
+        
         # Team context detection
-        for team in self.booking_context['teams']:
-            if team in content:
-                if meeting_type == MeetingType.TECHNICAL and team in ['platform', 'data']:
-                    boost += 0.1
-                elif meeting_type == MeetingType.STRATEGY and team in ['flights', 'accommodations']:
-                    boost += 0.1
+        for team in teams:
+            if team in term_counts:
+                boost += 0.1
                     
         # Business terms
-        business_term_count = sum(1 for term in self.booking_context['business_terms'] if term in content)
+        business_term_count = sum(1 for term in self.booking_context['business_terms'] if term in term_counts)
         if business_term_count > 0:
-            if meeting_type == MeetingType.STRATEGY:
-                boost += business_term_count * 0.05
-            elif meeting_type == MeetingType.TECHNICAL:
-                boost += business_term_count * 0.03
+            boost += business_term_count * business_term_weight
                 
         return boost
 
-class AdaptivePromptBuilder:
-    """Builds meeting type-specific prompts for better analysis"""
-    
-    def __init__(self):
-        self.base_template = self._load_base_template()
-        
-    def _load_base_template(self) -> str:
-        """Load the universal meeting prompt template"""
-        return """You are an expert meeting analyst specialized in {company_context}. Your job is to create useful summaries for any type of meeting.
+# Human-readable meeting type names used in prompt headings
+MEETING_TYPE_DISPLAY = MappingProxyType({
+    meeting_type: meeting_type.value.replace('_', ' ').title() for meeting_type in MeetingType
+})
+
+# Universal meeting prompt; filled in per meeting by AdaptivePromptBuilder.build_prompt
+BASE_TEMPLATE = """You are an expert meeting analyst specialized in {company_context}. Your job is to create useful summaries for any type of meeting.
 
 MEETING CONTEXT:
 - Type: {meeting_type}
@@ -268,50 +362,19 @@ IMPORTANT RULES:
 2. Don't invent information not in the transcript
 3. Focus on information most relevant to {meeting_type} meetings
 4. If action items aren't clear, note "Action items unclear - follow up needed"
-5. Prioritize Booking.com specific context (teams, products, business metrics)
+5. Prioritize Booking.com specific context (teams, products, business metrics)"""
+
+# Appended when the prompt carries the transcript itself; providers that are
+# given the transcript separately get the template without it
+TRANSCRIPT_SECTION = """
 
 TRANSCRIPT:
 {transcript}"""
 
-    def build_prompt(self, meeting_type: MeetingType, context: MeetingContext, transcript: str) -> str:
-        """Build adaptive prompt based on meeting type and context"""
-        
-        # Get type-specific instructions
-        type_instructions = self._get_type_specific_instructions(meeting_type)
-        
-        # Format participants
-        participants_str = ", ".join(context.participants) if context.participants else "Not specified"
-        
-        # Build additional context
-        additional_context = self._build_additional_context(context)
-        
-        # Format the prompt
-        prompt = self.base_template.format(
-            company_context="Booking.com Engineering meetings",
-            meeting_type=meeting_type.value,
-            meeting_type_display=meeting_type.value.replace('_', ' ').title(),
-            participants=participants_str,
-            participants_list=participants_str,
-            additional_context=additional_context,
-            type_specific_instructions=type_instructions['instructions'],
-            date="[Extract from transcript or context]",
-            duration=context.duration_estimate or "[Estimate from content]",
-            outcomes_instruction=type_instructions['outcomes'],
-            discussion_points_instruction=type_instructions['discussion_points'],
-            action_items_instruction=type_instructions['action_items'],
-            followups_instruction=type_instructions['followups'],
-            blockers_instruction=type_instructions['blockers'],
-            transcript=transcript
-        )
-        
-        return prompt
-
-    def _get_type_specific_instructions(self, meeting_type: MeetingType) -> Dict[str, str]:
-        """Get specialized instructions for each meeting type"""
-        
-        instructions = {
-            MeetingType.TECHNICAL: {
-                'instructions': """FOR TECHNICAL MEETINGS:
+# Specialized prompt sections for each meeting type
+TYPE_INSTRUCTIONS = MappingProxyType({
+    MeetingType.TECHNICAL: MappingProxyType({
+        'instructions': """FOR TECHNICAL MEETINGS:
 Focus on:
 - Systems/APIs/technologies discussed
 - Architecture decisions made
@@ -320,15 +383,15 @@ Focus on:
 - Code review feedback
 - Technical debt discussions
 - Performance considerations""",
-                'outcomes': '[2-3 sentence summary of technical decisions and next steps]',
-                'discussion_points': '[Bullet points of technical topics: systems discussed, decisions made, technical challenges]',
-                'action_items': '[Technical tasks, code reviews, implementation work with owners and timelines]',
-                'followups': '[Technical follow-ups, additional design work, code review schedules]',
-                'blockers': '[Technical blockers, dependency issues, infrastructure problems]'
-            },
-            
-            MeetingType.STRATEGY: {
-                'instructions': """FOR STRATEGY MEETINGS:
+        'outcomes': '[2-3 sentence summary of technical decisions and next steps]',
+        'discussion_points': '[Bullet points of technical topics: systems discussed, decisions made, technical challenges]',
+        'action_items': '[Technical tasks, code reviews, implementation work with owners and timelines]',
+        'followups': '[Technical follow-ups, additional design work, code review schedules]',
+        'blockers': '[Technical blockers, dependency issues, infrastructure problems]'
+    }),
+    
+    MeetingType.STRATEGY: MappingProxyType({
+        'instructions': """FOR STRATEGY MEETINGS:
 Focus on:
 - Goals and objectives
 - Business decisions
@@ -337,15 +400,15 @@ Focus on:
 - Business metrics and targets
 - Product direction
 - Market opportunities""",
-                'outcomes': '[2-3 sentence summary of strategic decisions and business direction]',
-                'discussion_points': '[Strategic topics: business goals, product direction, resource decisions]',
-                'action_items': '[Strategic tasks with owners, timelines, and success metrics]',
-                'followups': '[Strategic planning sessions, business reviews, metric tracking]',
-                'blockers': '[Business blockers, resource constraints, market challenges]'
-            },
-            
-            MeetingType.ALIGNMENT: {
-                'instructions': """FOR ALIGNMENT MEETINGS:
+        'outcomes': '[2-3 sentence summary of strategic decisions and business direction]',
+        'discussion_points': '[Strategic topics: business goals, product direction, resource decisions]',
+        'action_items': '[Strategic tasks with owners, timelines, and success metrics]',
+        'followups': '[Strategic planning sessions, business reviews, metric tracking]',
+        'blockers': '[Business blockers, resource constraints, market challenges]'
+    }),
+    
+    MeetingType.ALIGNMENT: MappingProxyType({
+        'instructions': """FOR ALIGNMENT MEETINGS:
 Focus on:
 - Dependencies between teams
 - Coordination points
@@ -353,15 +416,15 @@ Focus on:
 - Communication protocols
 - Cross-team handoffs
 - Workflow coordination""",
-                'outcomes': '[2-3 sentence summary of alignment agreements and coordination plans]',
-                'discussion_points': '[Coordination topics: team dependencies, handoff processes, communication needs]',
-                'action_items': '[Coordination tasks, communication improvements, dependency resolution]',
-                'followups': '[Regular sync meetings, dependency check-ins, coordination reviews]',
-                'blockers': '[Cross-team blockers, communication gaps, dependency issues]'
-            },
-            
-            MeetingType.ONE_ON_ONE: {
-                'instructions': """FOR 1:1 MEETINGS:
+        'outcomes': '[2-3 sentence summary of alignment agreements and coordination plans]',
+        'discussion_points': '[Coordination topics: team dependencies, handoff processes, communication needs]',
+        'action_items': '[Coordination tasks, communication improvements, dependency resolution]',
+        'followups': '[Regular sync meetings, dependency check-ins, coordination reviews]',
+        'blockers': '[Cross-team blockers, communication gaps, dependency issues]'
+    }),
+    
+    MeetingType.ONE_ON_ONE: MappingProxyType({
+        'instructions': """FOR 1:1 MEETINGS:
 Focus on:
 - Performance feedback
 - Career development topics
@@ -369,15 +432,15 @@ Focus on:
 - Manager guidance
 - Growth opportunities
 - Individual challenges""",
-                'outcomes': '[2-3 sentence summary of career discussion and personal development focus]',
-                'discussion_points': '[Personal development topics: career goals, feedback, growth opportunities]',
-                'action_items': '[Personal development tasks, career actions, skill building activities]',
-                'followups': '[Career development check-ins, skill assessment, growth plan reviews]',
-                'blockers': '[Personal blockers, skill gaps, career progression challenges]'
-            },
-            
-            MeetingType.STANDUP: {
-                'instructions': """FOR STANDUP MEETINGS:
+        'outcomes': '[2-3 sentence summary of career discussion and personal development focus]',
+        'discussion_points': '[Personal development topics: career goals, feedback, growth opportunities]',
+        'action_items': '[Personal development tasks, career actions, skill building activities]',
+        'followups': '[Career development check-ins, skill assessment, growth plan reviews]',
+        'blockers': '[Personal blockers, skill gaps, career progression challenges]'
+    }),
+    
+    MeetingType.STANDUP: MappingProxyType({
+        'instructions': """FOR STANDUP MEETINGS:
 Focus on:
 - Work completed
 - Current focus
@@ -385,30 +448,88 @@ Focus on:
 - Next priorities
 - Sprint progress
 - Team coordination""",
-                'outcomes': '[2-3 sentence summary of team progress and immediate priorities]',
-                'discussion_points': '[Status updates: completed work, current tasks, team progress]',
-                'action_items': '[Immediate tasks, blocker resolution, sprint commitments]',
-                'followups': '[Daily coordination, sprint planning, blocker resolution]',
-                'blockers': '[Individual blockers, team impediments, immediate help needed]'
-            },
-            
-            MeetingType.GENERAL_SYNC: {
-                'instructions': """FOR GENERAL SYNC MEETINGS:
+        'outcomes': '[2-3 sentence summary of team progress and immediate priorities]',
+        'discussion_points': '[Status updates: completed work, current tasks, team progress]',
+        'action_items': '[Immediate tasks, blocker resolution, sprint commitments]',
+        'followups': '[Daily coordination, sprint planning, blocker resolution]',
+        'blockers': '[Individual blockers, team impediments, immediate help needed]'
+    }),
+    
+    MeetingType.GENERAL_SYNC: MappingProxyType({
+        'instructions': """FOR GENERAL SYNC MEETINGS:
 Focus on:
 - Key updates shared
 - Decisions requiring follow-up
 - Information flow between teams
 - General coordination
 - Mixed topics discussed""",
-                'outcomes': '[2-3 sentence summary of key updates and decisions]',
-                'discussion_points': '[General topics: updates, decisions, information sharing]',
-                'action_items': '[Various tasks and follow-ups identified]',
-                'followups': '[Regular coordination, information sharing, decision follow-ups]',
-                'blockers': '[General blockers and coordination issues]'
-            }
-        }
+        'outcomes': '[2-3 sentence summary of key updates and decisions]',
+        'discussion_points': '[General topics: updates, decisions, information sharing]',
+        'action_items': '[Various tasks and follow-ups identified]',
+        'followups': '[Regular coordination, information sharing, decision follow-ups]',
+        'blockers': '[General blockers and coordination issues]'
+    })
+})
+
+@lru_cache(maxsize=8)
+def _template_parts(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """
+    Split a str.format template into (literal text, field name) pairs once,
+    so filling it in is a plain join rather than a re-parse per prompt.
+    Placeholders are plain {field} names; format specs are not applied.
+    """
+    return tuple((literal, field_name) for literal, field_name, _, _ in Formatter().parse(template))
+
+class AdaptivePromptBuilder:
+    """Builds meeting type-specific prompts for better analysis"""
+    
+    def __init__(self):
+        self.base_template = BASE_TEMPLATE
+
+    def build_prompt(self, meeting_type: MeetingType, context: MeetingContext,
+                     transcript: Optional[str] = None) -> str:
+        """Build adaptive prompt based on meeting type and context, ending with the transcript if given"""
         
-        return instructions.get(meeting_type, instructions[MeetingType.GENERAL_SYNC])
+        # Get type-specific instructions
+        type_instructions = self._get_type_specific_instructions(meeting_type)
+        
+        # Format participants
+        participants_str = ", ".join(context.participants) if context.participants else "Not specified"
+        
+        # Build additional context
+        additional_context = self._build_additional_context(context)
+        
+        # Fill in the prompt
+        values = dict(
+            company_context="Booking.com Engineering meetings",
+            meeting_type=meeting_type.value,
+            meeting_type_display=MEETING_TYPE_DISPLAY[meeting_type],
+            participants=participants_str,
+            participants_list=participants_str,
+            additional_context=additional_context,
+            type_specific_instructions=type_instructions['instructions'],
+            date="[Extract from transcript or context]",
+            duration=context.duration_estimate or "[Estimate from content]",
+            outcomes_instruction=type_instructions['outcomes'],
+            discussion_points_instruction=type_instructions['discussion_points'],
+            action_items_instruction=type_instructions['action_items'],
+            followups_instruction=type_instructions['followups'],
+            blockers_instruction=type_instructions['blockers'],
+            transcript=transcript
+        )
+        
+        template = self.base_template if transcript is None else self.base_template + TRANSCRIPT_SECTION
+        parts = []
+        for literal, field_name in _template_parts(template):
+            parts.append(literal)
+            if field_name is not None:
+                parts.append(str(values[field_name]))
+        
+        return ''.join(parts)
+
+    def _get_type_specific_instructions(self, meeting_type: MeetingType) -> Mapping[str, str]:
+        """Get specialized instructions for each meeting type"""
+        return TYPE_INSTRUCTIONS.get(meeting_type, TYPE_INSTRUCTIONS[MeetingType.GENERAL_SYNC])
 
     def _build_additional_context(self, context: MeetingContext) -> str:
         """Build additional context information"""
@@ -428,6 +549,12 @@ Focus on:
             
         return "\n".join(context_parts) if context_parts else "- No additional context available"
 
+@lru_cache(maxsize=16)
+def _read_config(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML config file; cached per (path, mtime) so edits are picked up."""
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
+
 class UniversalMeetingAnalyzer:
     """Main class for universal meeting intelligence"""
     
@@ -446,8 +573,7 @@ class UniversalMeetingAnalyzer:
         
         if config_path:
             try:
-                with open(config_path, 'r') as f:
-                    user_config = yaml.safe_load(f)
+                user_config = _read_config(config_path, os.stat(config_path).st_mtime_ns)
                 default_config.update(user_config.get('universal_meeting_analyzer', {}))
             except Exception as e:
                 logger.warning(f"Could not load config from {config_path}: {e}")
@@ -537,7 +663,6 @@ class UniversalMeetingAnalyzer:
         if 'folder_path' in metadata:
             folder_path = metadata['folder_path']
             # Extract folder name as potential meeting title
-            import os
             folder_name = os.path.basename(folder_path)
             if folder_name and folder_name != 'Zoom':
                 return folder_name
@@ -547,16 +672,12 @@ class UniversalMeetingAnalyzer:
     def _detect_booking_team(self, metadata: Dict[str, Any], title: Optional[str]) -> Optional[str]:
         """Detect which Booking.com team this meeting belongs to"""
         
-        search_text = ""
-        if title:
-            search_text += title.lower() + " "
-        if 'folder_path' in metadata:
-            search_text += metadata['folder_path'].lower() + " "
-            
-        # Check for team indicators
-        for team in self.detector.booking_context['teams']:
-            if team in search_text:
-                return team.title()
+        # Check for team indicators, in the title first
+        for search_text in (title, metadata.get('folder_path')):
+            if search_text:
+                match = TEAM_PATTERN.search(search_text)
+                if match:
+                    return match.group(1).title()
                 
         return None
 
@@ -574,16 +695,27 @@ class UniversalMeetingAnalyzer:
         
         for participant in participants:
             # Look for role indicators in names/emails
-            participant_lower = participant.lower()
-            for role_abbr, role_full in self.detector.booking_context['roles'].items():
-                if role_abbr in participant_lower:
-                    roles[participant] = role_full
-                    break
+            match = ROLE_PATTERN.search(participant.lower())
+            if match:
+                roles[participant] = self.detector.booking_context['roles'][match.group(1)]
                     
         return roles
 
-    def get_adaptive_prompt(self, transcript: str, metadata: Dict[str, Any] = None) -> str:
-        """Get the adaptive prompt that would be used for this meeting"""
-        context = self._build_meeting_context(metadata or {})
-        meeting_type, _ = self.detector.detect_meeting_type(transcript, context)
-        return self.prompt_builder.build_prompt(meeting_type, context, transcript) 
\ No newline at end of file
+    def get_adaptive_prompt(self, transcript: str, metadata: Dict[str, Any] = None,
+                            analysis: Optional[MeetingAnalysis] = None,
+                            include_transcript: bool = True) -> str:
+        """
+        Get the adaptive prompt that would be used for this meeting.
+        
+        Pass the meeting's MeetingAnalysis to reuse its type and context
+        instead of detecting them again; metadata is then ignored. Set
+        include_transcript to False when the transcript is sent to the
+        provider separately, so it isn't sent twice.
+        """
+        if analysis is not None:
+            context, meeting_type = analysis.context, analysis.meeting_type
+        else:
+            context = self._build_meeting_context(metadata or {})
+            meeting_type, _ = self.detector.detect_meeting_type(transcript, context)
+        return self.prompt_builder.build_prompt(meeting_type, context,
+                                                transcript if include_transcript else None) 
\ No newline at end of file
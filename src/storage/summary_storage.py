@@ -4,47 +4,116 @@ Handles saving meeting summaries to organized files.
 """
 
 import os
+import re
 import json
+import secrets
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
+from collections import defaultdict
 from datetime import datetime
 from dataclasses import asdict
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # Optional: metadata falls back to the standard json encoder
+    orjson = None
 
 from ..processing.ai_processor import ProcessingResult, MeetingMetadata
-from ..utils.config import get_config
+from ..utils.config import get_config, is_feature_enabled
 from ..utils.logger import get_logger, log_performance_metrics
 
 
+GENERATOR = "Pensieve v1.0"
+
+# Filename-unsafe characters and their replacements; runs of underscores collapse to one
+FILENAME_TRANSLATION = str.maketrans({
+    '/': '_', '\\': '_', ':': '-', '*': '_', '?': '_',
+    '"': '_', '<': '_', '>': '_', '|': '_', ' ': '_'
+})
+UNDERSCORE_RUNS = re.compile(r'__+')
+
+
+@lru_cache(maxsize=256)
+def _parse_meeting_date(date_part: str) -> Optional[datetime]:
+    """Parse a YYYY-MM-DD meeting date (cached per string), or return None if it isn't one."""
+    try:
+        if len(date_part) == 10 and date_part[4::3] == '--':
+            # Canonical form: fromisoformat is the C fast path for what strptime accepts here
+            return datetime.fromisoformat(date_part)
+        return datetime.strptime(date_part, "%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write data to path through a temporary file, an fsync and a rename.
+    
+    Readers never see a partially written file, and after a crash or power
+    loss path holds either its old or its new content. Each write uses its
+    own temporary file, so concurrent writers of the same path don't clobber
+    each other's data.
+    """
+    tmp_path = f"{path}.{secrets.token_hex(4)}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            # The data must be on disk before the rename makes it visible
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    
+    # Persist the rename itself where directories can be synced (not on Windows).
+    # The file is already in place, so a failure here must not fail the save
+    if hasattr(os, 'O_DIRECTORY'):
+        try:
+            dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
+
+
 class SummaryStorage:
     """Handles storage and organization of meeting summaries."""
     
+    PATH_CACHE_SIZE = 256
+    
     def __init__(self):
         self.config = get_config()
         self.logger = get_logger("summary_storage")
         self.summaries_folder = Path(self.config.output.summaries_folder)
+        # String form for building summary paths in one Path parse instead of three joins
+        self._summaries_folder_str = str(self.summaries_folder)
+        # Folders this instance has already created, so saves skip the mkdir
+        self._known_dirs = set()
+        # (date, title) -> summary path, for meetings whose date parsed
+        self._path_cache: Dict[tuple, Path] = {}
         
         # Create summaries folder if it doesn't exist
         self._ensure_directories_exist()
     
     def _ensure_directories_exist(self):
-        """Create necessary directories for storing summaries."""
+        """Create the summaries folder; year and month folders are created on first save."""
         try:
             self.summaries_folder.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(self.summaries_folder)
             
-            # Create year folders for current and next year
-            current_year = datetime.now().year
-            for year in [current_year, current_year + 1]:
-                year_folder = self.summaries_folder / str(year)
-                year_folder.mkdir(exist_ok=True)
-                
-                # Create month folders for current year
-                if year == current_year:
-                    for month in range(1, 13):
-                        month_name = datetime(year, month, 1).strftime("%m-%B")
-                        month_folder = year_folder / month_name
-                        month_folder.mkdir(exist_ok=True)
-            
-            self.logger.debug(f"Directory structure created: {self.summaries_folder}")
+            self.logger.debug(f"Summaries folder ready: {self.summaries_folder}")
             
         except Exception as e:
             self.logger.error(f"Failed to create directories: {e}")
@@ -64,25 +133,27 @@ class SummaryStorage:
             self.logger.warning("Cannot save incomplete processing result")
             return None
         
-        start_time = datetime.now()
+        start_time = time.perf_counter()
+        now = datetime.now()
         
         try:
             # Generate file path
             summary_path = self._generate_file_path(result.metadata)
             
             # Create the summary content
-            summary_content = self._format_summary_content(result)
+            summary_content = self._format_summary_content(result, now)
             
             # Save to file
-            summary_path.parent.mkdir(parents=True, exist_ok=True)
+            if summary_path.parent not in self._known_dirs:
+                summary_path.parent.mkdir(parents=True, exist_ok=True)
+                self._known_dirs.add(summary_path.parent)
             
-            with open(summary_path, 'w', encoding='utf-8') as f:
-                f.write(summary_content)
+            _write_atomic(summary_path, summary_content.encode('utf-8'))
             
             # Save metadata separately
-            metadata_path = self._save_metadata(result, summary_path)
+            metadata_path = self._save_metadata(result, summary_path, now)
             
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             log_performance_metrics(
                 "summary_storage",
                 processing_time,
@@ -95,7 +166,9 @@ class SummaryStorage:
             return summary_path
             
         except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds()
+            # A folder may have been removed behind our back; recreate it next time
+            self._known_dirs.clear()
+            processing_time = time.perf_counter() - start_time
             log_performance_metrics("summary_storage", processing_time, success=False)
             self.logger.error(f"Failed to save summary: {e}")
             return None
@@ -110,6 +183,12 @@ class SummaryStorage:
         Returns:
             Path where the summary should be saved.
         """
+        # The path only depends on the meeting date and title once the date parses
+        key = (metadata.date, metadata.title)
+        cached = self._path_cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
             # Parse date from metadata
             if " " in metadata.date:
@@ -118,10 +197,10 @@ class SummaryStorage:
                 date_part = metadata.date
             
             # Try to parse the date
-            try:
-                parsed_date = datetime.strptime(date_part, "%Y-%m-%d")
-            except ValueError:
-                # Fallback to current date if parsing fails
+            parsed_date = _parse_meeting_date(date_part)
+            date_parsed = parsed_date is not None
+            if not date_parsed:
+                # Fallback to current date if parsing fails (not cached)
                 parsed_date = datetime.now()
                 self.logger.warning(f"Could not parse date '{date_part}', using current date")
             
@@ -132,14 +211,19 @@ class SummaryStorage:
             # Generate filename
             filename = self._generate_filename(metadata, parsed_date)
             
-            return self.summaries_folder / str(year) / month_name / filename
+            path = Path(f"{self._summaries_folder_str}/{year}/{month_name}/{filename}")
+            if date_parsed:
+                if len(self._path_cache) >= self.PATH_CACHE_SIZE:
+                    self._path_cache.clear()
+                self._path_cache[key] = path
+            return path
             
         except Exception as e:
             self.logger.error(f"Error generating file path: {e}")
             # Fallback to current date structure
             now = datetime.now()
             filename = f"{now.strftime('%Y-%m-%d_%H-%M')}_meeting_summary.md"
-            return self.summaries_folder / str(now.year) / now.strftime("%m-%B") / filename
+            return Path(f"{self._summaries_folder_str}/{now.year}/{now.strftime('%m-%B')}/{filename}")
     
     def _generate_filename(self, metadata: MeetingMetadata, parsed_date: datetime) -> str:
         """
@@ -182,76 +266,56 @@ class SummaryStorage:
     
     def _clean_filename(self, title: str) -> str:
         """Clean a title to be filesystem-safe."""
-        # Replace problematic characters
-        replacements = {
-            '/': '_', '\\': '_', ':': '-', '*': '_', '?': '_',
-            '"': '_', '<': '_', '>': '_', '|': '_', ' ': '_'
-        }
-        
-        clean_title = title
-        for old, new in replacements.items():
-            clean_title = clean_title.replace(old, new)
-        
-        # Remove consecutive underscores and limit length
-        while '__' in clean_title:
-            clean_title = clean_title.replace('__', '_')
-        
-        clean_title = clean_title.strip('_')
-        
-        # Limit length
-        return clean_title[:50] if len(clean_title) > 50 else clean_title
+        # Replace problematic characters, collapse runs of underscores, limit length
+        clean_title = UNDERSCORE_RUNS.sub('_', title.translate(FILENAME_TRANSLATION)).strip('_')
+        return clean_title[:50]
     
-    def _format_summary_content(self, result: ProcessingResult) -> str:
+    def _format_summary_content(self, result: ProcessingResult, now: Optional[datetime] = None) -> str:
         """
         Format the complete summary content including metadata.
         
         Args:
             result: ProcessingResult to format.
+            now: Generation time for the header and footer (defaults to now).
             
         Returns:
             Formatted summary content.
         """
         metadata = result.metadata
+        now = now or datetime.now()
         
-        # Header with metadata
-        header = f"""---
+        # Header with metadata, main summary content, footer with technical details
+        return f"""---
 # Meeting Summary
 **Meeting**: {metadata.title}
 **Date**: {metadata.date}
 **Duration**: {metadata.duration}
 **Participants**: {', '.join(metadata.participants)}
 **Type**: {metadata.meeting_type}
-**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+**Generated**: {now.strftime('%Y-%m-%d %H:%M:%S')}
 **Model**: {result.model_used}
 **Processing Time**: {result.processing_time:.1f}s
 ---
 
-"""
-        
-        # Main summary content
-        content = result.summary
-        
-        # Footer with technical details
-        footer = f"""
+{result.summary}
 
 ---
 ## Technical Details
-- **Source File**: `{Path(metadata.file_path).name}`
+- **Source File**: `{os.path.basename(metadata.file_path)}`
 - **File Size**: {metadata.file_size:,} bytes
 - **Participants Count**: {len(metadata.participants)}
-- **Generated by**: Pensieve v1.0
-- **Timestamp**: {datetime.now().isoformat()}
+- **Generated by**: {GENERATOR}
+- **Timestamp**: {now.isoformat()}
 """
-        
-        return header + content + footer
     
-    def _save_metadata(self, result: ProcessingResult, summary_path: Path) -> Path:
+    def _save_metadata(self, result: ProcessingResult, summary_path: Path, now: Optional[datetime] = None) -> Path:
         """
         Save metadata as a separate JSON file.
         
         Args:
             result: ProcessingResult containing metadata.
             summary_path: Path where the summary was saved.
+            now: Creation time to record (defaults to now).
             
         Returns:
             Path to the metadata file.
@@ -265,19 +329,23 @@ class SummaryStorage:
                     "model_used": result.model_used,
                     "error": result.error
                 },
-                "meeting_metadata": asdict(result.metadata),
+                # orjson serializes dataclasses natively, without asdict's deep copy
+                "meeting_metadata": result.metadata if orjson is not None else asdict(result.metadata),
                 "file_info": {
                     "summary_path": str(summary_path),
-                    "created_at": datetime.now().isoformat(),
-                    "generator": "Pensieve v1.0"
+                    "created_at": (now or datetime.now()).isoformat(),
+                    "generator": GENERATOR
                 }
             }
             
             # Save metadata file alongside summary
             metadata_path = summary_path.with_suffix('.json')
             
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata_dict, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                payload = orjson.dumps(metadata_dict, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(metadata_dict, indent=2, ensure_ascii=False).encode('utf-8')
+            _write_atomic(metadata_path, payload)
             
             return metadata_path
             
@@ -286,6 +354,26 @@ class SummaryStorage:
             # Return a dummy path so the main operation doesn't fail
             return summary_path.with_suffix('.json')
     
+    def _walk_files(self) -> Iterator[os.DirEntry]:
+        """
+        Yield every file under the summaries folder.
+        
+        Uses os.scandir so callers can use the DirEntry's name without a
+        stat, and its cached stat() for size and mtime. Unreadable or
+        missing directories are skipped, as rglob does.
+        """
+        pending = [self._summaries_folder_str]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+            except OSError:
+                continue
+    
     def get_recent_summaries(self, days: int = 7) -> list:
         """
         Get recently created summaries.
@@ -300,17 +388,19 @@ class SummaryStorage:
         recent_summaries = []
         
         try:
-            for summary_file in self.summaries_folder.rglob("*_summary.md"):
-                if summary_file.stat().st_mtime > cutoff_date:
-                    recent_summaries.append(summary_file)
+            for entry in self._walk_files():
+                if entry.name.endswith("_summary.md"):
+                    mtime = entry.stat().st_mtime
+                    if mtime > cutoff_date:
+                        recent_summaries.append((mtime, entry.path))
             
             # Sort by modification time (newest first)
-            recent_summaries.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+            recent_summaries.sort(reverse=True)
             
         except Exception as e:
             self.logger.error(f"Error getting recent summaries: {e}")
         
-        return recent_summaries
+        return [Path(path) for _, path in recent_summaries]
     
     def get_storage_stats(self) -> Dict[str, Any]:
         """
@@ -320,30 +410,40 @@ class SummaryStorage:
             Dictionary with storage statistics.
         """
         try:
-            summary_files = list(self.summaries_folder.rglob("*_summary.md"))
-            metadata_files = list(self.summaries_folder.rglob("*.json"))
-            
-            total_size = sum(f.stat().st_size for f in summary_files)
-            
-            # Count by year/month
-            by_period = {}
-            for file_path in summary_files:
-                try:
-                    parts = file_path.relative_to(self.summaries_folder).parts
-                    if len(parts) >= 2:
-                        period = f"{parts[0]}/{parts[1]}"
-                        by_period[period] = by_period.get(period, 0) + 1
-                except:
+            total_summaries = 0
+            metadata_files = 0
+            total_size = 0
+            last_summary = 0
+            by_period = defaultdict(int)
+            # Entry paths are the scanned root plus a relative path; slicing it off is
+            # cheaper than Path.relative_to
+            root_len = len(os.path.join(self._summaries_folder_str, ""))
+            
+            # One walk and one stat per summary; count by year/month as we go
+            for entry in self._walk_files():
+                if entry.name.endswith(".json"):
+                    metadata_files += 1
+                    continue
+                if not entry.name.endswith("_summary.md"):
                     continue
+                
+                stat = entry.stat()
+                total_summaries += 1
+                total_size += stat.st_size
+                last_summary = max(last_summary, stat.st_mtime)
+                
+                parts = entry.path[root_len:].split(os.sep, 2)
+                if len(parts) >= 2:
+                    by_period[parts[0], parts[1]] += 1
             
             return {
-                "total_summaries": len(summary_files),
+                "total_summaries": total_summaries,
                 "total_size_bytes": total_size,
                 "total_size_mb": round(total_size / (1024 * 1024), 2),
-                "metadata_files": len(metadata_files),
-                "by_period": by_period,
+                "metadata_files": metadata_files,
+                "by_period": {f"{year}/{month}": count for (year, month), count in by_period.items()},
                 "storage_path": str(self.summaries_folder),
-                "last_summary": max((f.stat().st_mtime for f in summary_files), default=0)
+                "last_summary": last_summary
             }
             
         except Exception as e:
@@ -366,11 +466,13 @@ class SummaryStorage:
         try:
             expected_path = self._generate_file_path(metadata)
             
-            if expected_path.exists():
+            if os.path.exists(expected_path):
                 return expected_path
             
-            # Also check for similar files in the same directory
-            if expected_path.parent.exists():
+            # Optionally also check for similar files in the same directory. This lists
+            # the whole month folder and also matches other meetings with the same title
+            # (e.g. last week's standup), so it is off unless enabled
+            if is_feature_enabled('duplicate_fuzzy_match') and expected_path.parent.exists():
                 pattern = f"*{self._clean_filename(metadata.title)}*_summary.md"
                 matches = list(expected_path.parent.glob(pattern))
                 if matches:
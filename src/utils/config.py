@@ -9,6 +9,11 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # Optional: PyYAML built without libyaml uses the pure-Python loader
+    from yaml import SafeLoader
+
 
 @dataclass
 class MonitoringConfig:
@@ -112,11 +117,19 @@ class ConfigManager:
         
         self.config_path = Path(config_path)
         self._config: Optional[PensieveConfig] = None
+        # (mtime_ns, size) of the file self._config was loaded from
+        self._loaded_stamp: Optional[tuple] = None
+        # Snapshots of the loaded features and meeting type keywords for the accessors
+        self._enabled_features: frozenset = frozenset()
+        self._meeting_type_keywords: Dict[str, list] = {}
         
     def load_config(self) -> PensieveConfig:
         """
         Load configuration from YAML file.
         
+        Returns the already loaded configuration if the file hasn't changed
+        since it was read.
+        
         Returns:
             Loaded configuration object.
             
@@ -125,12 +138,18 @@ class ConfigManager:
             yaml.YAMLError: If config file is invalid YAML.
             ValueError: If required configuration keys are missing.
         """
-        if not self.config_path.exists():
-            raise FileNotFoundError(f"Config file not found: {self.config_path}")
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {self.config_path}") from None
+        
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self._config is not None and stamp == self._loaded_stamp:
+            return self._config
         
         try:
-            with open(self.config_path, 'r') as f:
-                raw_config = yaml.safe_load(f)
+            # libyaml's loader parses the raw bytes directly, detecting the encoding itself
+            raw_config = yaml.load(self.config_path.read_bytes(), Loader=SafeLoader)
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"Invalid YAML in config file: {e}")
         
@@ -159,6 +178,14 @@ class ConfigManager:
         
         # Expand paths
         self._expand_paths()
+        self._loaded_stamp = stamp
+        self._enabled_features = frozenset(
+            name for name, enabled in self._config.features.items() if enabled
+        )
+        self._meeting_type_keywords = {
+            name: (settings or {}).get('keywords', [])
+            for name, settings in self._config.meeting_types.items()
+        }
         
         return self._config
     
@@ -207,10 +234,12 @@ class ConfigManager:
         """
         Reload configuration from file.
         
+        Only re-parses when the file changed since the last load; otherwise
+        this costs a single stat.
+        
         Returns:
             Reloaded configuration object.
         """
-        self._config = None
         return self.load_config()
     
     def get_zoom_folder(self) -> str:
@@ -227,7 +256,7 @@ class ConfigManager:
     
     def is_feature_enabled(self, feature_name: str) -> bool:
         """
-        Check if a feature is enabled.
+        Check if a feature is enabled in the loaded configuration file.
         
         Args:
             feature_name: Name of the feature to check.
@@ -235,7 +264,9 @@ class ConfigManager:
         Returns:
             True if feature is enabled, False otherwise.
         """
-        return self.config.features.get(feature_name, False)
+        if self._config is None:
+            self.load_config()
+        return feature_name in self._enabled_features
     
     def get_meeting_type_keywords(self, meeting_type: str) -> list:
         """
@@ -247,8 +278,9 @@ class ConfigManager:
         Returns:
             List of keywords for the meeting type.
         """
-        meeting_config = self.config.meeting_types.get(meeting_type, {})
-        return meeting_config.get('keywords', [])
+        if self._config is None:
+            self.load_config()
+        return self._meeting_type_keywords.get(meeting_type, [])
 
 
 # Global config manager instance
@@ -262,4 +294,9 @@ def get_config() -> PensieveConfig:
 
 def reload_config() -> PensieveConfig:
     """Reload the global configuration."""
-    return config_manager.reload_config() 
\ No newline at end of file
+    return config_manager.reload_config()
+
+
+def is_feature_enabled(feature_name: str) -> bool:
+    """Check a feature flag in the global configuration."""
+    return config_manager.is_feature_enabled(feature_name)
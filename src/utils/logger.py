@@ -7,6 +7,7 @@ import logging
 import logging.handlers
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from rich.console import Console
@@ -19,18 +20,18 @@ class PensieveFormatter(logging.Formatter):
     """Custom formatter for Pensieve logs."""
     
     def __init__(self):
-        super().__init__()
         self.default_fmt = '[%(asctime)s] %(levelname)8s | %(name)s | %(message)s'
         self.detailed_fmt = '[%(asctime)s] %(levelname)8s | %(name)s:%(lineno)d | %(funcName)s() | %(message)s'
+        super().__init__(self.default_fmt)
+        # Both styles are built once; format() picks one per record instead of
+        # rewriting the shared style's format string
+        self._detailed_style = logging.PercentStyle(self.detailed_fmt)
     
-    def format(self, record):
+    def formatMessage(self, record):
         # Use detailed format for DEBUG level
         if record.levelno == logging.DEBUG:
-            self._style._fmt = self.detailed_fmt
-        else:
-            self._style._fmt = self.default_fmt
-        
-        return super().format(record)
+            return self._detailed_style.format(record)
+        return self._style.format(record)
 
 
 class PensieveLogger:
@@ -192,9 +193,10 @@ def setup_logging(force_reload: bool = False) -> logging.Logger:
     return _pensieve_logger.setup(force_reload=force_reload)
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """
-    Get a logger instance.
+    Get a logger instance (cached per name; loggers are process-wide singletons).
     
     Args:
         name: Logger name. If None, returns main logger.
@@ -239,15 +241,15 @@ def log_performance_metrics(operation: str, duration: float, success: bool = Tru
         **kwargs: Additional metadata to log.
     """
     logger = get_logger("performance")
+    level = logging.INFO if success else logging.ERROR
+    if not logger.isEnabledFor(level):
+        return
     
     status = "✅ SUCCESS" if success else "❌ FAILED"
-    extra_info = " | ".join(f"{k}={v}" for k, v in kwargs.items())
-    
-    message = f"{status} | {operation} | {duration:.2f}s"
-    if extra_info:
-        message += f" | {extra_info}"
     
-    if success:
-        logger.info(message)
+    # %-style arguments are only formatted if a handler emits the record
+    if kwargs:
+        extra_info = " | ".join(f"{k}={v}" for k, v in kwargs.items())
+        logger.log(level, "%s | %s | %.2fs | %s", status, operation, duration, extra_info)
     else:
-        logger.error(message) 
\ No newline at end of file
+        logger.log(level, "%s | %s | %.2fs", status, operation, duration)
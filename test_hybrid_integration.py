@@ -5,100 +5,60 @@ Tests the complete integration of Universal Intelligence + Hybrid AI Processing.
 """
 
 import os
-import sys
 import time
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
 from src.processing.pensieve_hybrid_processor import PensieveHybridProcessor, create_pensieve_processor
 from src.processing.universal_meeting_analyzer import MeetingType
 from src.processing.ai_providers import AIResponse
 
 
+def process_with_summary(processor, transcript_file, content, provider="claude",
+                         model="claude-3-5-sonnet-20241022", **response_fields):
+    """Process a transcript with the best provider mocked to return the given summary."""
+    with patch.object(processor.ai_provider_manager, 'get_best_provider') as mock_provider:
+        mock_ai_provider = Mock()
+        mock_ai_provider.generate_summary.return_value = AIResponse(
+            success=True,
+            content=content,
+            provider_used=provider,
+            model_used=model,
+            **response_fields
+        )
+        mock_provider.return_value = mock_ai_provider
+        
+        return processor.process_transcript(transcript_file)
+
+
 class TestHybridIntegration:
     """Test the complete hybrid integration."""
     
-    @pytest.fixture
-    def sample_transcript(self):
-        """Sample transcript for testing."""
-        return """
-        John Smith 09:00:15
-        Good morning everyone, let's start with our architecture review for the new booking service.
-        
-        Alice Johnson 09:00:30
-        Thanks John. I've been working on the microservice design for our payment flow.
-        
-        Bob Wilson 09:01:00
-        Great work Alice. I have some concerns about the database scalability approach.
-        
-        John Smith 09:01:15
-        Let's discuss the technical trade-offs. We need to consider performance implications.
-        
-        Alice Johnson 09:02:00
-        The service-oriented architecture will help us scale better than our current monolith.
-        
-        Bob Wilson 09:02:30
-        I agree. My action item is to create a performance testing plan by next week.
-        
-        John Smith 09:03:00
-        Perfect. Alice, can you finalize the API specifications by Friday?
-        
-        Alice Johnson 09:03:15
-        Absolutely. I'll have the complete API documentation ready.
-        """
-    
-    @pytest.fixture
-    def mock_transcript_file(self, tmp_path, sample_transcript):
-        """Create a mock transcript file."""
-        meeting_folder = tmp_path / "2025-01-18 09.00.00 Architecture Review Meeting"
-        meeting_folder.mkdir()
-        
-        transcript_file = meeting_folder / "meeting_saved_closed_caption.txt"
-        transcript_file.write_text(sample_transcript)
-        
-        return transcript_file
-    
-    def test_hybrid_processor_initialization(self):
+    def test_hybrid_processor_initialization(self, processor):
         """Test that hybrid processor initializes correctly."""
-        processor = create_pensieve_processor()
-        
         assert processor is not None
         assert hasattr(processor, 'universal_analyzer')
         assert hasattr(processor, 'hybrid_processor')
         assert hasattr(processor, 'ai_provider_manager')
         assert hasattr(processor, 'transcript_parser')
     
-    def test_meeting_type_detection_integration(self, mock_transcript_file):
+    def test_meeting_type_detection_integration(self, processor, mock_transcript_file):
         """Test that meeting type detection works in the integrated system."""
-        processor = create_pensieve_processor()
-        
         # Mock the AI response to focus on testing integration
-        with patch.object(processor.ai_provider_manager, 'get_best_provider') as mock_provider:
-            mock_ai_provider = Mock()
-            mock_ai_provider.generate_summary.return_value = AIResponse(
-                success=True,
-                content="# Technical Architecture Review\n\n## Key Decisions\n- Microservice approach approved\n\n## Action Items\n- [ ] Performance testing plan (Bob)\n- [ ] API documentation (Alice)",
-                provider_used="ollama",
-                model_used="llama3.1:8b",
-                processing_time=5.0
-            )
-            mock_provider.return_value = mock_ai_provider
-            
-            result = processor.process_transcript(mock_transcript_file)
-            
-            assert result.success == True
-            assert result.meeting_analysis.meeting_type == MeetingType.TECHNICAL
-            assert result.meeting_analysis.confidence > 0.8
-            assert "Architecture Review" in result.metadata.title
+        result = process_with_summary(
+            processor, mock_transcript_file,
+            "# Technical Architecture Review\n\n## Key Decisions\n- Microservice approach approved\n\n## Action Items\n- [ ] Performance testing plan (Bob)\n- [ ] API documentation (Alice)",
+            provider="ollama", model="llama3.1:8b", processing_time=5.0
+        )
+        
+        assert result.success == True
+        assert result.meeting_analysis.meeting_type == MeetingType.TECHNICAL
+        assert result.meeting_analysis.confidence > 0.8
+        assert "Architecture Review" in result.metadata.title
     
-    def test_adaptive_prompt_generation(self, mock_transcript_file):
+    def test_adaptive_prompt_generation(self, processor, mock_transcript_file):
         """Test that adaptive prompts are generated correctly."""
-        processor = create_pensieve_processor()
-        
         # Get the transcript content
         transcript_content, _ = processor.transcript_parser.parse_transcript(mock_transcript_file)
         
@@ -113,10 +73,8 @@ class TestHybridIntegration:
         assert "technical" in adaptive_prompt.lower()
         assert "architecture" in adaptive_prompt.lower() or "api" in adaptive_prompt.lower()
     
-    def test_provider_selection_logic(self, mock_transcript_file):
+    def test_provider_selection_logic(self, processor, mock_transcript_file):
         """Test that the right provider is selected based on meeting type."""
-        processor = create_pensieve_processor()
-        
         with patch.object(processor.ai_provider_manager, 'providers') as mock_providers:
             # Mock both providers available
             claude_provider = Mock()
@@ -148,10 +106,8 @@ class TestHybridIntegration:
                 assert result.success == True
                 assert result.ai_provider_used == "claude"
     
-    def test_quality_assessment_integration(self, mock_transcript_file):
+    def test_quality_assessment_integration(self, processor, mock_transcript_file):
         """Test that quality assessment works correctly."""
-        processor = create_pensieve_processor()
-        
         # Mock AI response with known content
         mock_summary = """
         # Technical Architecture Review Summary
@@ -170,70 +126,39 @@ class TestHybridIntegration:
         Performance implications and scalability were key considerations.
         """
         
-        with patch.object(processor.ai_provider_manager, 'get_best_provider') as mock_provider:
-            mock_ai_provider = Mock()
-            mock_ai_provider.generate_summary.return_value = AIResponse(
-                success=True,
-                content=mock_summary,
-                provider_used="claude",
-                model_used="claude-3-5-sonnet-20241022"
-            )
-            mock_provider.return_value = mock_ai_provider
-            
-            result = processor.process_transcript(mock_transcript_file)
-            
-            assert result.success == True
-            assert result.quality_metrics is not None
-            assert result.quality_metrics.action_items_count >= 2
-            assert result.quality_metrics.technical_terms_count >= 3
-            assert result.quality_metrics.overall_score > 0.7
+        result = process_with_summary(processor, mock_transcript_file, mock_summary)
+        
+        assert result.success == True
+        assert result.quality_metrics is not None
+        assert result.quality_metrics.action_items_count >= 2
+        assert result.quality_metrics.technical_terms_count >= 3
+        assert result.quality_metrics.overall_score > 0.7
     
-    def test_intelligence_boost_calculation(self, mock_transcript_file):
+    def test_intelligence_boost_calculation(self, processor, mock_transcript_file):
         """Test intelligence boost calculation."""
-        processor = create_pensieve_processor()
+        result = process_with_summary(
+            processor, mock_transcript_file, "High-quality summary with technical content and action items"
+        )
         
-        with patch.object(processor.ai_provider_manager, 'get_best_provider') as mock_provider:
-            mock_ai_provider = Mock()
-            mock_ai_provider.generate_summary.return_value = AIResponse(
-                success=True,
-                content="High-quality summary with technical content and action items",
-                provider_used="claude",
-                model_used="claude-3-5-sonnet-20241022"
-            )
-            mock_provider.return_value = mock_ai_provider
-            
-            result = processor.process_transcript(mock_transcript_file)
-            
-            assert result.success == True
-            assert result.intelligence_boost > 0
-            assert result.intelligence_boost <= 50.0  # Should be capped
+        assert result.success == True
+        assert result.intelligence_boost > 0
+        assert result.intelligence_boost <= 50.0  # Should be capped
     
-    def test_recommendations_generation(self, mock_transcript_file):
+    def test_recommendations_generation(self, processor, mock_transcript_file):
         """Test that actionable recommendations are generated."""
-        processor = create_pensieve_processor()
+        result = process_with_summary(
+            processor, mock_transcript_file, "Basic summary without much detail",
+            provider="ollama", model="llama3.1:8b"
+        )
         
-        with patch.object(processor.ai_provider_manager, 'get_best_provider') as mock_provider:
-            mock_ai_provider = Mock()
-            mock_ai_provider.generate_summary.return_value = AIResponse(
-                success=True,
-                content="Basic summary without much detail",
-                provider_used="ollama",
-                model_used="llama3.1:8b"
-            )
-            mock_provider.return_value = mock_ai_provider
-            
-            result = processor.process_transcript(mock_transcript_file)
-            
-            assert result.success == True
-            assert result.recommendations is not None
-            assert len(result.recommendations) > 0
-            # Should recommend Claude for better quality
-            assert any("Claude" in rec for rec in result.recommendations)
+        assert result.success == True
+        assert result.recommendations is not None
+        assert len(result.recommendations) > 0
+        # Should recommend Claude for better quality
+        assert any("Claude" in rec for rec in result.recommendations)
     
-    def test_error_handling_integration(self, mock_transcript_file):
+    def test_error_handling_integration(self, processor, mock_transcript_file):
         """Test error handling in the integrated system."""
-        processor = create_pensieve_processor()
-        
         # Test with provider failure
         with patch.object(processor.ai_provider_manager, 'get_best_provider') as mock_provider:
             mock_provider.return_value = None  # No provider available
@@ -244,10 +169,8 @@ class TestHybridIntegration:
             assert result.error is not None
             assert "No available AI provider" in result.error
     
-    def test_fallback_mechanism(self, mock_transcript_file):
+    def test_fallback_mechanism(self, processor, mock_transcript_file):
         """Test provider fallback mechanism."""
-        processor = create_pensieve_processor()
-        
         with patch.object(processor.ai_provider_manager, 'get_best_provider') as mock_provider:
             # Primary provider fails
             mock_primary = Mock()
@@ -272,16 +195,24 @@ class TestHybridIntegration:
                 assert result.ai_provider_used == "ollama"
                 mock_fallback.assert_called_once()
     
-    def test_processing_stats_tracking(self, mock_transcript_file):
+    def test_processing_stats_tracking(self, processor, mock_transcript_file):
         """Test that processing statistics are tracked correctly."""
-        processor = create_pensieve_processor()
-        
         initial_stats = processor.get_processing_stats()
         assert initial_stats["total_processed"] == 0
         
         # Mock successful processing
+        process_with_summary(processor, mock_transcript_file, "Test summary")
+        
+        updated_stats = processor.get_processing_stats()
+        assert updated_stats["total_processed"] == 1
+        assert updated_stats["claude_used"] == 1
+        assert updated_stats["avg_quality_score"] > 0
+    
+    def test_response_cache_reuses_summary(self, processor, mock_transcript_file):
+        """Test that re-processing an unchanged transcript reuses the cached AI response."""
         with patch.object(processor.ai_provider_manager, 'get_best_provider') as mock_provider:
             mock_ai_provider = Mock()
+            mock_ai_provider.config.name = "claude"
             mock_ai_provider.generate_summary.return_value = AIResponse(
                 success=True,
                 content="Test summary",
@@ -290,12 +221,86 @@ class TestHybridIntegration:
             )
             mock_provider.return_value = mock_ai_provider
             
-            processor.process_transcript(mock_transcript_file)
+            first = processor.process_transcript(mock_transcript_file)
+            second = processor.process_transcript(mock_transcript_file)
+            assert first.summary == second.summary == "Test summary"
+            assert mock_ai_provider.generate_summary.call_count == 1
             
-            updated_stats = processor.get_processing_stats()
-            assert updated_stats["total_processed"] == 1
-            assert updated_stats["claude_used"] == 1
-            assert updated_stats["avg_quality_score"] > 0
+            processor.process_transcript(mock_transcript_file, force=True)
+            assert mock_ai_provider.generate_summary.call_count == 2
+        
+        stats = processor.get_processing_stats()
+        assert stats["cache_hits"] == 1
+        assert stats["cache_misses"] == 1
+    
+    def test_regenerate_with_provider_forces_provider(self, processor, mock_transcript_file):
+        """Test that regeneration uses the requested provider without routing."""
+        forced_provider = Mock()
+        forced_provider.config.name = "ollama"
+        forced_provider.generate_summary.return_value = AIResponse(
+            success=True,
+            content="Regenerated summary",
+            provider_used="ollama",
+            model_used="llama3.1:8b"
+        )
+        
+        with patch.object(processor.ai_provider_manager, 'get_provider', return_value=forced_provider), \
+             patch.object(processor.ai_provider_manager, 'get_best_provider') as mock_best:
+            result = processor.regenerate_with_provider(mock_transcript_file, "ollama")
+        
+        assert result.success
+        assert result.ai_provider_used == "ollama"
+        mock_best.assert_not_called()
+    
+    def test_long_transcript_is_preprocessed(self, processor, mock_transcript_file, sample_transcript, tmp_path):
+        """Test that long transcripts are trimmed before they reach the AI provider."""
+        processor.preprocessing_enabled = True
+        # The shared transcript file is read-only; write the long one to its own meeting folder
+        meeting_folder = tmp_path / mock_transcript_file.parent.name
+        meeting_folder.mkdir()
+        long_transcript_file = meeting_folder / mock_transcript_file.name
+        long_transcript_file.write_text(sample_transcript * 40)
+
+        with patch.object(processor.ai_provider_manager, 'get_best_provider') as mock_provider:
+            mock_ai_provider = Mock()
+            mock_ai_provider.config.name = "claude"
+            mock_ai_provider.generate_summary.return_value = AIResponse(
+                success=True,
+                content="Test summary",
+                provider_used="claude",
+                model_used="claude-3-5-sonnet-20241022"
+            )
+            mock_provider.return_value = mock_ai_provider
+
+            result = processor.process_transcript(long_transcript_file)
+            sent_prompt, sent_transcript, sent_context = mock_ai_provider.generate_summary.call_args[0]
+
+            # The untrimmed transcript is a different payload, so it must not reuse the cached response
+            processor.preprocessing_enabled = False
+            processor.process_transcript(long_transcript_file)
+            assert mock_ai_provider.generate_summary.call_count == 2
+
+        assert result.success
+        assert result.preprocessing_stats["words_saved"] > 0
+        assert "09:00:15" not in sent_transcript
+        assert "09:00:15" not in sent_prompt
+        assert "TRANSCRIPT:" not in sent_prompt  # providers append the transcript once
+        assert sent_context.estimated_tokens == len(sent_transcript) // 4
+
+    def test_process_many_preserves_order(self, processor, tmp_path):
+        """Test that batch processing returns one result per file, in input order."""
+        import asyncio
+        
+        file_paths = [tmp_path / f"meeting_{i}.txt" for i in range(4)]
+        
+        def fake_process(file_path):
+            time.sleep(0.01 * (4 - int(file_path.stem[-1])))  # Later files finish first
+            return file_path.name
+        
+        with patch.object(processor, 'process_transcript', side_effect=fake_process):
+            results = asyncio.run(processor.process_many(file_paths, max_concurrency=2))
+        
+        assert results == [file_path.name for file_path in file_paths]
     
     def test_environment_variable_detection(self):
         """Test API key detection from environment variables."""
@@ -315,7 +320,7 @@ class TestHybridIntegration:
 class TestRealTranscriptProcessing:
     """Test with real transcript files if available."""
     
-    def test_with_real_zoom_transcript(self):
+    def test_with_real_zoom_transcript(self, processor):
         """Test with real Zoom transcript if available."""
         zoom_folder = Path.home() / "Documents" / "Zoom"
         
@@ -331,8 +336,6 @@ class TestRealTranscriptProcessing:
         # Test with the most recent transcript
         latest_transcript = max(transcript_files, key=lambda p: p.stat().st_mtime)
         
-        processor = create_pensieve_processor()
-        
         # Mock AI providers to avoid API calls in tests
         with patch.object(processor.ai_provider_manager, 'get_best_provider') as mock_provider:
             mock_ai_provider = Mock()
@@ -357,12 +360,13 @@ def run_integration_tests():
     print("🧪 Running Pensieve Hybrid Integration Tests")
     print("=" * 60)
     
-    # Create test instance
+    # Create test instance and the processor the tests share
     test_instance = TestHybridIntegration()
+    processor = create_pensieve_processor()
     
     # Run basic tests
     print("🔧 Testing hybrid processor initialization...")
-    test_instance.test_hybrid_processor_initialization()
+    test_instance.test_hybrid_processor_initialization(processor)
     print("✅ Initialization test passed")
     
     # Create mock transcript for other tests
@@ -385,11 +389,11 @@ def run_integration_tests():
         transcript_file.write_text(sample_transcript)
         
         print("🎯 Testing meeting type detection...")
-        test_instance.test_meeting_type_detection_integration(transcript_file)
+        test_instance.test_meeting_type_detection_integration(processor, transcript_file)
         print("✅ Meeting type detection test passed")
         
         print("📝 Testing adaptive prompt generation...")
-        test_instance.test_adaptive_prompt_generation(transcript_file)
+        test_instance.test_adaptive_prompt_generation(processor, transcript_file)
         print("✅ Adaptive prompt test passed")
     
     print("\n🎉 All integration tests passed!")
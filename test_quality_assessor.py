@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for summary quality assessment.
+Checks the keyword matcher against plain substring checks and the assessor's scoring.
+"""
+
+import pytest
+
+from src.processing.hybrid_ai_processor import (
+    KeywordMatcher,
+    TECHNICAL_TERMS,
+    GENERIC_PHRASES,
+)
+
+
+def test_keyword_matcher_handles_overlapping_terms():
+    """Terms nested in other terms are found alongside them."""
+    matcher = KeywordMatcher(TECHNICAL_TERMS)
+    text = "we moved the javascript microservices to kubernetes"
+
+    expected = {term for term in TECHNICAL_TERMS if term in text}
+
+    assert matcher.find(text) == expected
+    assert {"java", "javascript", "service", "microservices"} <= matcher.find(text)
+    assert matcher.count(text) == len(expected)
+
+
+def test_keyword_matcher_phrases():
+    """Multi-word phrases match as substrings; absent terms are not reported."""
+    matcher = KeywordMatcher(GENERIC_PHRASES)
+
+    assert matcher.find("moving forward, the team discussed next steps") == {
+        "moving forward", "the team discussed", "next steps"
+    }
+    assert matcher.find("concrete owners and deadlines") == set()
+    assert matcher.find("") == set()
+
+
+def test_assess_summary_quality_batch_matches_single():
+    """Batch assessment gives the same metrics as assessing one summary at a time."""
+    from src.processing.ai_processor import MeetingMetadata
+    from src.processing.hybrid_ai_processor import QualityAssessor
+
+    assessor = QualityAssessor()
+    summaries = [
+        "## Decisions\n- Move the API to kubernetes\n- [ ] Alice: update the database schema",
+        "Moving forward, the team discussed next steps.",
+    ]
+    metadatas = [
+        MeetingMetadata(title="Sync", date="2024-01-01", duration="30m", participants=["Alice"],
+                        meeting_type="one_on_one", file_path="sync.txt", file_size=1024),
+        MeetingMetadata(title="Review", date="2024-01-02", duration="45m", participants=["Bob"],
+                        meeting_type="team_meeting", file_path="review.txt", file_size=2048),
+    ]
+    providers = ["claude", "ollama"]
+
+    batch = assessor.assess_summary_quality_batch(summaries, metadatas, providers)
+
+    assert batch == [
+        assessor.assess_summary_quality(summary, metadata, provider)
+        for summary, metadata, provider in zip(summaries, metadatas, providers)
+    ]
+    with pytest.raises(ValueError):
+        assessor.assess_summary_quality_batch(summaries, metadatas[:1], providers)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Tests for summary storage.
+Saves processing results into a temporary summaries folder and reads them back.
+"""
+
+import json
+import os
+import shutil
+import stat
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.processing.ai_processor import MeetingMetadata, ProcessingResult
+from src.storage import summary_storage
+from src.storage.summary_storage import SummaryStorage
+
+
+def make_result(title="Flights Team: Weekly Sync", date="2024-03-05 14:30:00", summary="## Summary\n- Ünïcode ✅"):
+    metadata = MeetingMetadata(
+        title=title, date=date, duration="45m", participants=["Alice", "Zoë"],
+        meeting_type="team_meeting", file_path="/zoom/2024-03-05 14.30.00 Sync/meeting_saved_closed_caption.txt",
+        file_size=12345,
+    )
+    return ProcessingResult(success=True, summary=summary, metadata=metadata,
+                            processing_time=1.5, model_used="llama3.1:8b")
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run metadata tests with orjson and with the standard library fallback."""
+    if request.param == "json":
+        monkeypatch.setattr(summary_storage, "orjson", None)
+    return request.param
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    """A SummaryStorage writing under tmp_path."""
+    config = SimpleNamespace(output=SimpleNamespace(summaries_folder=str(tmp_path / "summaries")), features={})
+    monkeypatch.setattr(summary_storage, "get_config", lambda: config)
+    monkeypatch.setattr(summary_storage, "is_feature_enabled", lambda name: config.features.get(name, False))
+    return SummaryStorage()
+
+
+def test_save_summary_writes_summary_and_metadata(storage, json_backend):
+    """The summary and its JSON sidecar land in the dated folder with the expected contents."""
+    result = make_result()
+
+    path = storage.save_summary(result)
+
+    assert path == storage.summaries_folder / "2024" / "03-March" / "2024-03-05_14-30_Flights_Team-_Weekly_Sync_summary.md"
+    text = path.read_text(encoding="utf-8")
+    assert "**Meeting**: Flights Team: Weekly Sync" in text
+    assert result.summary in text
+    assert "- **Source File**: `meeting_saved_closed_caption.txt`" in text
+
+    raw = path.with_suffix(".json").read_text(encoding="utf-8")
+    assert '"Zoë"' in raw  # written as UTF-8, not \u escapes
+    metadata = json.loads(raw)
+    assert metadata["processing_result"] == {
+        "success": True, "processing_time": 1.5, "model_used": "llama3.1:8b", "error": None
+    }
+    assert metadata["meeting_metadata"]["participants"] == ["Alice", "Zoë"]
+    assert metadata["file_info"]["summary_path"] == str(path)
+
+    # Header, footer and sidecar record the same generation time
+    created = datetime.fromisoformat(metadata["file_info"]["created_at"])
+    assert f"**Generated**: {created:%Y-%m-%d %H:%M:%S}" in text
+    assert f"- **Timestamp**: {created.isoformat()}" in text
+
+
+def test_save_summary_rejects_incomplete_result(storage):
+    """Failed or empty results are not written."""
+    assert storage.save_summary(ProcessingResult(success=False, error="boom")) is None
+    assert storage.get_recent_summaries() == []
+
+
+def test_storage_stats_and_recent_summaries(storage):
+    """Stats and recent summaries agree with the files on disk."""
+    first = storage.save_summary(make_result(title="Planning", date="2024-03-05 09:00:00"))
+    second = storage.save_summary(make_result(title="Retro", date="2024-04-12 16:00:00"))
+    (storage.summaries_folder / "notes.txt").write_text("not a summary")
+    os.utime(first, (1_000_000_000, 1_000_000_000))
+
+    stats = storage.get_storage_stats()
+
+    assert stats["total_summaries"] == 2
+    assert stats["metadata_files"] == 2
+    assert stats["total_size_bytes"] == first.stat().st_size + second.stat().st_size
+    assert stats["by_period"] == {"2024/03-March": 1, "2024/04-April": 1}
+    assert stats["last_summary"] == second.stat().st_mtime
+    assert storage.get_recent_summaries(days=1) == [second]
+    assert storage.get_recent_summaries(days=100_000) == [second, first]
+
+
+def test_save_summary_creates_month_folders_on_demand(storage):
+    """Only the summaries folder exists up front; month folders appear on save."""
+    assert list(storage.summaries_folder.iterdir()) == []
+
+    path = storage.save_summary(make_result())
+    assert path.exists()
+
+    # A month folder removed while running is recreated after the failed save
+    shutil.rmtree(path.parent)
+    assert storage.save_summary(make_result()) is None
+    assert storage.save_summary(make_result()) == path
+    assert path.exists()
+
+
+def test_save_summary_replaces_files_atomically(storage, monkeypatch):
+    """Saves leave no temporary files, and a failed write keeps the previous summary intact."""
+    path = storage.save_summary(make_result(summary="first version"))
+    assert sorted(p.name for p in path.parent.iterdir()) == sorted([path.name, path.with_suffix(".json").name])
+
+    def failing_write(fd, data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(summary_storage.os, "write", failing_write)
+    assert storage.save_summary(make_result(summary="second version")) is None
+
+    assert "first version" in path.read_text(encoding="utf-8")
+    assert sorted(p.name for p in path.parent.iterdir()) == sorted([path.name, path.with_suffix(".json").name])
+
+
+def test_write_atomic_syncs_before_rename(tmp_path, monkeypatch):
+    """The temporary file is synced before the rename, and each write gets its own temporary file."""
+    calls = []
+    real_fsync, real_replace = os.fsync, os.replace
+    monkeypatch.setattr(summary_storage.os, "fsync", lambda fd: calls.append("fsync") or real_fsync(fd))
+    monkeypatch.setattr(summary_storage.os, "replace",
+                        lambda src, dst: calls.append(("replace", src)) or real_replace(src, dst))
+
+    path = tmp_path / "summary.md"
+    summary_storage._write_atomic(path, b"first")
+    summary_storage._write_atomic(path, b"second")
+
+    assert path.read_bytes() == b"second"
+    assert [call if call == "fsync" else call[0] for call in calls] == ["fsync", "replace", "fsync"] * 2
+    assert calls[1][1] != calls[4][1]
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_write_atomic_tolerates_unsyncable_directory(tmp_path, monkeypatch):
+    """A directory that can't be synced after the rename doesn't fail a completed write."""
+    real_fsync = os.fsync
+
+    def fsync(fd):
+        if stat.S_ISDIR(os.fstat(fd).st_mode):
+            raise OSError("fsync not supported")
+        real_fsync(fd)
+
+    monkeypatch.setattr(summary_storage.os, "fsync", fsync)
+
+    path = tmp_path / "summary.md"
+    summary_storage._write_atomic(path, b"content")
+
+    assert path.read_bytes() == b"content"
+
+
+def test_check_duplicate_matches_exact_path(storage):
+    """Only the summary for the same meeting counts as a duplicate unless fuzzy matching is enabled."""
+    saved = storage.save_summary(make_result(title="Standup", date="2024-03-05 09:00:00"))
+    next_week = make_result(title="Standup", date="2024-03-12 09:00:00").metadata
+
+    assert storage.check_duplicate(make_result(title="Standup", date="2024-03-05 09:00:00").metadata) == saved
+    assert storage.check_duplicate(next_week) is None
+    assert storage._generate_file_path(next_week) is storage._generate_file_path(next_week)
+
+    storage.config.features["duplicate_fuzzy_match"] = True
+    assert storage.check_duplicate(next_week) == saved
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Tests for transcript preprocessing.
+Checks that Zoom noise is removed and that the noise regex covers every pattern.
+"""
+
+import pytest
+
+from src.processing.transcript_preprocessor import TranscriptPreprocessor, _first_char_class
+
+
+def test_remove_zoom_noise_matches_every_pattern():
+    """Each noise pattern is removed on its own, whatever its case."""
+    preprocessor = TranscriptPreprocessor()
+    samples = [
+        "09:00:15", "You are now recording this meeting", "recording in progress",
+        "THIS MEETING IS BEING RECORDED", "[PARTICIPANT_12]", "(phone ringing)",
+        "(Background Noise)", "(inaudible)", "[pause]", "[silence]",
+    ]
+    assert len(samples) == len(preprocessor.zoom_patterns)
+
+    for sample in samples:
+        assert preprocessor._zoom_regex.sub("", f"before {sample} after") == "before  after"
+
+
+def test_first_char_class_rejects_unknown_starts():
+    """Patterns whose first character can't be determined fail at load instead of never matching."""
+    assert _first_char_class([r"\d{2}", r"\[pause\]", "Recording"]) == r"[\d\[rR]"
+
+    for pattern in (r".*noise", "um|uh", "a?b", r"\w+"):
+        with pytest.raises(ValueError):
+            _first_char_class([pattern])
@@ -11,7 +11,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from processing.universal_meeting_analyzer import (
     UniversalMeetingAnalyzer, 
     MeetingType, 
-    MeetingContext
+    MeetingContext,
+    MeetingTypeDetector
 )
 import logging
 
@@ -295,6 +296,74 @@ def test_edge_cases():
     analysis = analyzer.analyze_meeting(mixed_transcript)
     print(f"Mixed signals → {analysis.meeting_type.value} (confidence: {analysis.confidence:.2f})")
 
+def test_content_scores_match_per_term_counts():
+    """Test that scoring from shared term counts equals counting each type's terms separately"""
+    detector = MeetingTypeDetector()
+
+    # Repeated and self-overlapping terms must be counted like str.count
+    transcripts = list(TEST_TRANSCRIPTS.values()) + ["statustatus q1q1 cross-team sync up sync", ""]
+    for transcript in transcripts:
+        content = transcript.lower()
+        expected = {
+            meeting_type: sum(content.count(keyword) * 0.5 for keyword in patterns['keywords'])
+                          + sum(content.count(phrase) * 1.0 for phrase in patterns['phrases'])
+            for meeting_type, patterns in detector.patterns.items()
+        }
+        assert detector._calculate_content_scores(detector._count_terms(content)) == expected
+
+def test_detection_reuses_transcript_scan():
+    """Test that repeated detection of the same transcript reuses its term counts"""
+    detector = MeetingTypeDetector()
+    context = MeetingContext(title="Daily Standup", participants=["Dev 1", "Dev 2", "Dev 3"])
+
+    first = detector.detect_meeting_type(TEST_TRANSCRIPTS["standup"], context)
+    assert detector.detect_meeting_type(TEST_TRANSCRIPTS["standup"], context) == first
+    assert len(detector._term_counts_cache) == 1
+
+    # Other metadata only changes the boosts; the transcript is not scanned again
+    other = detector.detect_meeting_type(TEST_TRANSCRIPTS["standup"], MeetingContext(title="Sync"))
+    assert other == MeetingTypeDetector().detect_meeting_type(TEST_TRANSCRIPTS["standup"], MeetingContext(title="Sync"))
+    assert len(detector._term_counts_cache) == 1
+
+def test_participant_roles_match_whole_abbreviations():
+    """Test that role abbreviations only match as whole words"""
+    analyzer = UniversalMeetingAnalyzer()
+
+    roles = analyzer._extract_participant_roles(
+        ["John (EM Flights)", "Sarah Johnson (PM)", "emily.stone@booking.com", "Team Lead A"]
+    )
+
+    assert roles == {
+        "John (EM Flights)": "Engineering Manager",
+        "Sarah Johnson (PM)": "Product Manager",
+    }
+
+def test_booking_team_prefers_title_and_whole_words():
+    """Test that team detection reads the title first and ignores partial words"""
+    analyzer = UniversalMeetingAnalyzer()
+
+    folder = {"folder_path": "/Users/test/Documents/Zoom/Flights Team Meeting"}
+    assert analyzer._detect_booking_team(folder, "Platform review") == "Platform"
+    assert analyzer._detect_booking_team(folder, "Database review") == "Flights"
+    assert analyzer._detect_booking_team({}, "Webinar prep") is None
+
+def test_adaptive_prompt_reuses_analysis():
+    """Test that get_adaptive_prompt builds on a given analysis without detecting again"""
+    analyzer = UniversalMeetingAnalyzer()
+    metadata = {"title": "Daily Standup", "participants": ["Dev 1", "Dev 2", "Dev 3"]}
+    transcript = TEST_TRANSCRIPTS["standup"]
+
+    analysis = analyzer.analyze_meeting(transcript, metadata)
+    expected = analyzer.get_adaptive_prompt(transcript, metadata)
+
+    analyzer.detector.detect_meeting_type = None  # any further detection would fail
+    assert analyzer.get_adaptive_prompt(transcript, analysis=analysis) == expected
+    assert analysis.quality_indicators["prompt_length"] == len(expected)
+
+    # Without the transcript the prompt is the same up to the transcript section
+    instructions = analyzer.get_adaptive_prompt(transcript, analysis=analysis, include_transcript=False)
+    assert instructions + "\n\nTRANSCRIPT:\n" + transcript == expected
+
 def main():
     """Run all tests"""
     print("🚀 Universal Meeting Intelligence System - Test Suite")